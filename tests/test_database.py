@@ -121,6 +121,75 @@ class TestDatabase:
         assert history[0]["composite_score"] == 0.55  # Most recent
         assert history[1]["composite_score"] == 0.45
 
+    @pytest.mark.asyncio
+    async def test_iter_receipts(self, test_db):
+        """Test lazy receipt iteration"""
+        from datetime import datetime, timedelta
+
+        await test_db.create_agent(
+            "stream-1", "Stream Agent", "openai", None, "hash", ["read"], None
+        )
+        now = datetime.utcnow()
+        for i in range(5):
+            await test_db.create_receipt(
+                receipt_id=f"stream-receipt-{i}",
+                agent_id="stream-1",
+                action="read_data",
+                result="success",
+                timestamp=now + timedelta(seconds=i),
+                signature="sig",
+                previous_hash=None,
+                receipt_hash=f"hash-{i}",
+            )
+
+        receipts = [r async for r in test_db.iter_receipts("stream-1", batch_size=2)]
+        assert len(receipts) == 5
+        assert receipts[0]["id"] == "stream-receipt-4"  # Newest first
+
+    @pytest.mark.asyncio
+    async def test_get_agents_with_last_receipt(self, test_db):
+        """Test batched last-receipt lookup"""
+        from datetime import datetime, timedelta
+
+        now = datetime.utcnow()
+        for agent_id in ("batch-1", "batch-2"):
+            await test_db.create_agent(
+                agent_id, f"Agent {agent_id}", "openai", None, "hash", ["read"], None
+            )
+        for i in range(3):
+            await test_db.create_receipt(
+                receipt_id=f"batch-receipt-{i}",
+                agent_id="batch-1",
+                action="read_data",
+                result="success",
+                timestamp=now + timedelta(seconds=i),
+                signature="sig",
+                previous_hash=None,
+                receipt_hash=f"hash-{i}",
+            )
+
+        by_agent = await test_db.get_agents_with_last_receipt(["batch-1", "batch-2"])
+        assert by_agent["batch-1"]["id"] == "batch-receipt-2"
+        assert "batch-2" not in by_agent  # no receipts yet
+
+        # Bulk-recorded receipts share one timestamp; insert order must
+        # break the tie so the chain tail is reported, not a mid-batch row
+        tied = now + timedelta(seconds=10)
+        for i in range(3):
+            await test_db.create_receipt(
+                receipt_id=f"tied-receipt-{i}",
+                agent_id="batch-1",
+                action="read_data",
+                result="success",
+                timestamp=tied,
+                signature="sig",
+                previous_hash=None,
+                receipt_hash=f"tied-hash-{i}",
+            )
+
+        by_agent = await test_db.get_agents_with_last_receipt(["batch-1"])
+        assert by_agent["batch-1"]["id"] == "tied-receipt-2"
+
     @pytest.mark.asyncio
     async def test_get_stats(self, test_db):
         """Test dashboard stats"""
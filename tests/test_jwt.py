@@ -1,6 +1,6 @@
 """Test JWT token issuance and verification"""
 import pytest
-from jose import JWTError
+from jwt import InvalidTokenError
 
 
 class TestJWT:
@@ -42,7 +42,7 @@ class TestJWT:
 
     def test_verify_invalid_token(self, trust_engine):
         """Test verification of invalid token"""
-        with pytest.raises(JWTError):
+        with pytest.raises(InvalidTokenError):
             trust_engine.verify_jwt_token("invalid-token")
 
     def test_get_permitted_actions(self, trust_engine):
@@ -60,3 +60,121 @@ class TestReceipts:
         )
 
         assert signature2 != signature  # Should be different
+
+    def test_verify_chain(self, trust_engine):
+        """Test full receipt chain verification"""
+        receipts = []
+        previous_hash = None
+        for i in range(3):
+            receipt_id = f"receipt-{i}"
+            timestamp = f"2024-01-01T00:0{i}:00Z"
+            signature = trust_engine.sign_receipt(
+                "test-agent", "send_email", "success", timestamp, previous_hash
+            )
+            receipt_hash = trust_engine.hash_receipt(receipt_id, signature)
+            receipts.append(
+                {
+                    "id": receipt_id,
+                    "agent_id": "test-agent",
+                    "action": "send_email",
+                    "result": "success",
+                    "timestamp": timestamp,
+                    "signature": signature,
+                    "previous_hash": previous_hash,
+                    "receipt_hash": receipt_hash,
+                }
+            )
+            previous_hash = receipt_hash
+
+        # Newest first, matching Database.get_receipts ordering
+        receipts.reverse()
+        assert trust_engine.verify_chain(receipts) is True
+
+        # Tampering with any field breaks the chain
+        receipts[0]["result"] = "failure"
+        assert trust_engine.verify_chain(receipts) is False
+
+    def test_blake2b_mac_mode(self):
+        """Test keyed blake2b MAC mode signs and verifies"""
+        from trust_gateway.trust_engine import TrustEngine
+
+        engine = TrustEngine(secret_key="blake2b-secret", mac_algo="blake2b")
+
+        signature = engine.sign_receipt(
+            "test-agent", "send_email", "success", "2024-01-01T00:00:00Z", None
+        )
+        assert len(signature) == 64  # blake2b-256 hex digest
+        assert engine.verify_receipt(
+            "test-agent", "send_email", "success", "2024-01-01T00:00:00Z", signature, None
+        )
+
+    def test_unsupported_mac_algo(self):
+        """Test unknown MAC algorithm is rejected"""
+        from trust_gateway.trust_engine import TrustEngine
+
+        with pytest.raises(ValueError):
+            TrustEngine(secret_key="secret", mac_algo="md5")
+
+    def test_verify_chain_details(self, trust_engine):
+        """Test per-receipt chain verification pinpoints tampering"""
+        receipts = []
+        previous_hash = None
+        for i in range(4):
+            receipt_id = f"receipt-{i}"
+            timestamp = f"2024-01-01T00:0{i}:00Z"
+            signature = trust_engine.sign_receipt(
+                "test-agent", "send_email", "success", timestamp, previous_hash
+            )
+            receipt_hash = trust_engine.hash_receipt(receipt_id, signature)
+            receipts.append(
+                {
+                    "id": receipt_id,
+                    "agent_id": "test-agent",
+                    "action": "send_email",
+                    "result": "success",
+                    "timestamp": timestamp,
+                    "signature": signature,
+                    "previous_hash": previous_hash,
+                    "receipt_hash": receipt_hash,
+                }
+            )
+            previous_hash = receipt_hash
+
+        receipts.reverse()
+        assert trust_engine.verify_chain_details(receipts) == [True] * 4
+
+        # Tamper with one receipt in the middle; only it should fail
+        receipts[1]["result"] = "failure"
+        details = trust_engine.verify_chain_details(receipts)
+        assert details == [True, False, True, True]
+
+    def test_verify_chain_legacy_sha256_hashes(self, trust_engine):
+        """Chains written before the blake2b switch still verify"""
+        import hashlib
+
+        receipts = []
+        previous_hash = None
+        for i in range(3):
+            receipt_id = f"receipt-{i}"
+            timestamp = f"2024-01-01T00:0{i}:00Z"
+            signature = trust_engine.sign_receipt(
+                "test-agent", "send_email", "success", timestamp, previous_hash
+            )
+            receipt_hash = hashlib.sha256(f"{receipt_id}|{signature}".encode()).hexdigest()
+            receipts.append(
+                {
+                    "id": receipt_id,
+                    "agent_id": "test-agent",
+                    "action": "send_email",
+                    "result": "success",
+                    "timestamp": timestamp,
+                    "signature": signature,
+                    "previous_hash": previous_hash,
+                    "receipt_hash": receipt_hash,
+                }
+            )
+            previous_hash = receipt_hash
+
+        receipts.reverse()
+        assert trust_engine.verify_chain(receipts) is True
+        assert trust_engine.verify_chain_details(receipts) == [True] * 3
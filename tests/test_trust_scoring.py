@@ -85,6 +85,24 @@ class TestTrustScoring:
         assert score < 0.7
         assert factors["violations"] == 1
 
+    def test_behavior_score_incremental_matches_full(self, trust_engine):
+        """Test incremental aggregates match a full recompute"""
+        results = ["success", "success", "failure", "violation", "success"]
+
+        state = {}
+        for result in results:
+            score, state = trust_engine.update_behavior_incrementally(state, [result])
+
+        # Full recompute expects receipts newest-first
+        receipts = [{"result": r} for r in reversed(results)]
+        full_score, factors = trust_engine.calculate_behavior_score(receipts)
+
+        assert abs(score - full_score) < 1e-9
+        assert state["action_count"] == factors["total_actions"]
+        assert state["success_count"] == factors["successes"]
+        assert state["failure_count"] == factors["failures"]
+        assert state["violation_count"] == factors["violations"]
+
     def test_composite_score(self, trust_engine):
         """Test composite score calculation"""
         identity = 0.8
@@ -108,3 +126,23 @@ class TestTrustScoring:
         assert trust_engine.determine_tier(0.3, tiers) == 1
         assert trust_engine.determine_tier(0.6, tiers) == 2
         assert trust_engine.determine_tier(0.9, tiers) == 3
+
+    def test_identity_score_fast_matches_full(self, trust_engine):
+        """Test the factor-free identity path matches the full one"""
+        agents = [
+            {},
+            {"name": "bot", "provider": "openai"},
+            {
+                "name": "bot",
+                "provider": "openai",
+                "spiffe_id": "spiffe://example.org/agent/bot",
+                "config_hash": "abc123",
+                "capabilities": ["read", "write", "deploy"],
+                "attestation": {"type": "x509"},
+            },
+            {"name": "bot", "attestation": {"type": "homegrown"}},
+        ]
+
+        for agent in agents:
+            full_score, _ = trust_engine.calculate_identity_score(agent)
+            assert trust_engine._identity_score_fast(agent) == full_score
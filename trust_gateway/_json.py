@@ -0,0 +1,12 @@
+"""
+Trust Gateway JSON Shim
+orjson-backed loads/dumps for TEXT-column (de)serialization
+"""
+import orjson
+
+loads = orjson.loads
+
+
+def dumps(obj) -> str:
+    """Serialize to a str (the JSON columns are TEXT, not BLOB)"""
+    return orjson.dumps(obj).decode()
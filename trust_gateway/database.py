@@ -1,17 +1,91 @@
 """Async database operations for Trust Gateway V2 - SQLAlchemy 2.0 + aiosqlite"""
-import json
-from datetime import datetime
-from typing import Optional, List, Dict, Any
+import asyncio
+import sys
+import time
+from contextvars import ContextVar
+from datetime import datetime, timedelta, timezone
+from typing import Optional, List, Dict, Any, Tuple
 from contextlib import asynccontextmanager
 
-from sqlalchemy import Column, String, Float, Integer, Text, DateTime, Boolean, select, func
+from sqlalchemy import (
+    Column,
+    String,
+    Float,
+    Integer,
+    BigInteger,
+    Text,
+    DateTime,
+    Boolean,
+    bindparam,
+    case,
+    delete,
+    event,
+    insert,
+    Index,
+    literal_column,
+    select,
+    update,
+    func,
+)
 from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession, async_sessionmaker
 from sqlalchemy.orm import declarative_base
+from sqlalchemy.pool import AsyncAdaptedQueuePool, StaticPool
 import structlog
 
+from . import _json as json
+
 Base = declarative_base()
 logger = structlog.get_logger()
 
+# Session bound to the current logical request by Database.request_scope
+_request_session: ContextVar[Optional[AsyncSession]] = ContextVar(
+    "_request_session", default=None
+)
+
+# Receipt/history timestamps are stored as INTEGER epoch-milliseconds,
+# skipping the ISO string format/parse that DateTime columns pay per row.
+# Datetimes cross this boundary naive-UTC, matching datetime.utcnow().
+_EPOCH = datetime(1970, 1, 1)
+_ONE_MS = timedelta(milliseconds=1)
+
+
+def _to_ms(ts: datetime) -> int:
+    if ts.tzinfo is not None:
+        ts = ts.astimezone(timezone.utc).replace(tzinfo=None)
+    return (ts - _EPOCH) // _ONE_MS
+
+
+def _from_ms(ms: int) -> datetime:
+    return _EPOCH + timedelta(milliseconds=ms)
+
+
+def _now_ms() -> int:
+    """Current time as epoch-ms without datetime object allocation"""
+    return time.time_ns() // 1_000_000
+
+
+# Agent rows are re-read by dashboards and by every authorize/record
+# call; a short TTL plus write invalidation keeps hits off SQLite
+# without serving stale scores.
+_AGENT_CACHE_TTL = 5.0
+_AGENT_CACHE_MAX = 10_000
+
+
+def _set_sqlite_pragmas(dbapi_connection, connection_record):
+    """Apply write-friendly SQLite PRAGMAs on every new connection
+
+    WAL turns each commit into a log append instead of a full-database
+    fsync, and NORMAL sync is safe under WAL. No-ops for in-memory DBs.
+    """
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA journal_mode=WAL")
+    cursor.execute("PRAGMA synchronous=NORMAL")
+    cursor.execute("PRAGMA temp_store=MEMORY")
+    cursor.execute("PRAGMA cache_size=-64000")
+    cursor.execute("PRAGMA mmap_size=268435456")
+    cursor.execute("PRAGMA busy_timeout=5000")
+    cursor.close()
+
 
 # ORM Models
 class AgentModel(Base):
@@ -33,20 +107,35 @@ class AgentModel(Base):
     tier = Column(Integer, default=0)
     config_changes = Column(Integer, default=0)
     last_config_hash = Column(String, nullable=True)
+    # Rolling behavior aggregates; recording an action updates these in
+    # O(1) instead of rescoring the full receipt chain
+    action_count = Column(Integer, default=0)
+    success_count = Column(Integer, default=0)
+    failure_count = Column(Integer, default=0)
+    violation_count = Column(Integer, default=0)
+    behavior_weighted = Column(Float, default=0.0)
 
 
 class ActionReceiptModel(Base):
     __tablename__ = "action_receipts"
 
     id = Column(String, primary_key=True)
-    agent_id = Column(String, nullable=False, index=True)
+    agent_id = Column(String, nullable=False)
     action = Column(String, nullable=False)
     result = Column(String, nullable=False)
-    timestamp = Column(DateTime, nullable=False, index=True)
+    timestamp = Column(BigInteger, nullable=False)  # epoch-ms
     signature = Column(String, nullable=False)
     previous_hash = Column(String, nullable=True)
     receipt_hash = Column(String, nullable=False)
 
+    # Receipt reads filter on agent_id and order by timestamp DESC; the
+    # composite index satisfies both without a sort step. The plain
+    # timestamp index bounds the stats "last 24h" cutoff scan.
+    __table_args__ = (
+        Index("ix_receipts_agent_ts", agent_id, timestamp.desc()),
+        Index("ix_receipts_ts", timestamp),
+    )
+
 
 class TrustTierModel(Base):
     __tablename__ = "trust_tiers"
@@ -74,22 +163,103 @@ class TrustHistoryModel(Base):
     __tablename__ = "trust_history"
 
     id = Column(Integer, primary_key=True, autoincrement=True)
-    agent_id = Column(String, nullable=False, index=True)
-    timestamp = Column(DateTime, nullable=False, index=True)
+    agent_id = Column(String, nullable=False)
+    timestamp = Column(BigInteger, nullable=False)  # epoch-ms
     composite_score = Column(Float, nullable=False)
     tier = Column(Integer, nullable=False)
     trigger = Column(String, nullable=False)
 
+    __table_args__ = (Index("ix_history_agent_ts", agent_id, timestamp.desc()),)
+
+
+# Hot-path statements hoisted to module scope with bound parameters, so
+# each call skips select() construction and hits the compiled cache and
+# SQLite's prepared-statement cache directly.
+_RECEIPT_COLS = (
+    ActionReceiptModel.id,
+    ActionReceiptModel.agent_id,
+    ActionReceiptModel.action,
+    ActionReceiptModel.result,
+    ActionReceiptModel.timestamp,
+    ActionReceiptModel.signature,
+    ActionReceiptModel.previous_hash,
+    ActionReceiptModel.receipt_hash,
+)
+
+GET_AGENT_STMT = select(AgentModel).where(AgentModel.id == bindparam("agent_id"))
+
+# Bulk-recorded receipts can share an epoch-ms timestamp; the rowid
+# tiebreaker keeps chain order deterministic (insert order) so the
+# previous_hash links always read back in the order they were signed.
+_RECEIPT_ORDER = (
+    ActionReceiptModel.timestamp.desc(),
+    literal_column("rowid").desc(),
+)
+
+GET_RECEIPTS_STMT = (
+    select(*_RECEIPT_COLS)
+    .where(ActionReceiptModel.agent_id == bindparam("agent_id"))
+    .order_by(*_RECEIPT_ORDER)
+)
+
+GET_RECEIPTS_LIMIT_STMT = GET_RECEIPTS_STMT.limit(bindparam("limit"))
+
+GET_LAST_RECEIPT_STMT = (
+    select(ActionReceiptModel)
+    .where(ActionReceiptModel.agent_id == bindparam("agent_id"))
+    .order_by(*_RECEIPT_ORDER)
+    .limit(1)
+)
+
+GET_LAST_RECEIPT_HASH_STMT = (
+    select(ActionReceiptModel.receipt_hash)
+    .where(ActionReceiptModel.agent_id == bindparam("agent_id"))
+    .order_by(*_RECEIPT_ORDER)
+    .limit(1)
+)
+
+GET_TRUST_HISTORY_STMT = (
+    select(
+        TrustHistoryModel.timestamp,
+        TrustHistoryModel.composite_score,
+        TrustHistoryModel.tier,
+        TrustHistoryModel.trigger,
+    )
+    .where(TrustHistoryModel.agent_id == bindparam("agent_id"))
+    .order_by(TrustHistoryModel.timestamp.desc())
+    .limit(bindparam("limit"))
+)
+
 
 class Database:
     """Async SQLAlchemy database manager"""
 
     def __init__(self, db_url: str = "sqlite+aiosqlite:///trust_gateway.db"):
         self.db_url = db_url
-        self.engine = create_async_engine(db_url, echo=False)
+        if ":memory:" in db_url:
+            # A pool of distinct connections would each see its own empty
+            # in-memory database; share the single connection instead.
+            self.engine = create_async_engine(db_url, echo=False, poolclass=StaticPool)
+        else:
+            # Keep warm connections (and their SQLite page caches) alive
+            # across requests instead of reconnecting per session.
+            self.engine = create_async_engine(
+                db_url,
+                echo=False,
+                poolclass=AsyncAdaptedQueuePool,
+                pool_size=5,
+                max_overflow=10,
+                pool_recycle=-1,
+            )
+        event.listen(self.engine.sync_engine, "connect", _set_sqlite_pragmas)
         self.async_session = async_sessionmaker(
             self.engine, class_=AsyncSession, expire_on_commit=False
         )
+        # Tier definitions are read per authorization check but change
+        # rarely; cache them in-process and invalidate on update_tier.
+        self._tier_cache: Optional[Dict[int, Dict]] = None
+        self._tier_cache_lock = asyncio.Lock()
+        self._agent_cache: Dict[str, Tuple[float, Dict[str, Any]]] = {}
         logger.info("database_initialized", db_url=db_url)
 
     async def init_db(self):
@@ -161,14 +331,44 @@ class Database:
 
     @asynccontextmanager
     async def session(self):
-        """Context manager for database sessions"""
+        """Context manager for database sessions
+
+        Inside a request_scope the scoped session is reused and the
+        scope owns commit/rollback; otherwise each call gets its own
+        session and transaction, as before.
+        """
+        scoped = _request_session.get()
+        if scoped is not None:
+            yield scoped
+            return
+        async with self.async_session() as session:
+            try:
+                yield session
+                await session.commit()
+            except Exception:
+                await session.rollback()
+                raise
+
+    @asynccontextmanager
+    async def request_scope(self):
+        """Share one session/transaction across a logical request
+
+        Collapses the per-method BEGIN/COMMIT pairs into one, so a
+        handler calling get_agent, get_last_receipt, and get_tier rides
+        a single transaction on one pooled connection. Not safe to
+        combine with concurrent queries on the same scope; helpers that
+        gather (get_stats) open their own sessions deliberately.
+        """
         async with self.async_session() as session:
+            token = _request_session.set(session)
             try:
                 yield session
                 await session.commit()
             except Exception:
                 await session.rollback()
                 raise
+            finally:
+                _request_session.reset(token)
 
     async def create_agent(
         self,
@@ -182,52 +382,86 @@ class Database:
     ) -> Dict[str, Any]:
         """Create a new agent"""
         async with self.session() as session:
-            agent = AgentModel(
-                id=agent_id,
-                name=name,
-                provider=provider,
-                spiffe_id=spiffe_id,
-                config_hash=config_hash,
-                capabilities=json.dumps(capabilities),
-                attestation_type=attestation.get("type") if attestation else None,
-                attestation_data=json.dumps(attestation) if attestation else None,
-                created_at=datetime.utcnow(),
-                composite_score=0.1,
-                last_config_hash=config_hash,
+            # RETURNING hands back the inserted row, saving a follow-up SELECT
+            stmt = (
+                insert(AgentModel)
+                .values(
+                    id=agent_id,
+                    name=name,
+                    provider=provider,
+                    spiffe_id=spiffe_id,
+                    config_hash=config_hash,
+                    capabilities=json.dumps(capabilities),
+                    attestation_type=attestation.get("type") if attestation else None,
+                    attestation_data=json.dumps(attestation) if attestation else None,
+                    created_at=datetime.utcnow(),
+                    composite_score=0.1,
+                    last_config_hash=config_hash,
+                )
+                .returning(AgentModel)
             )
-            session.add(agent)
+            agent = (await session.execute(stmt)).scalar_one()
+            agent_dict = self._agent_to_dict(agent)
 
+        self._agent_cache.pop(agent_id, None)
         logger.info("agent_created", agent_id=agent_id, name=name, provider=provider)
-        return await self.get_agent(agent_id)
+        return agent_dict
+
+    @staticmethod
+    def _agent_to_dict(agent: AgentModel) -> Dict[str, Any]:
+        return {
+            "id": agent.id,
+            "name": agent.name,
+            "provider": agent.provider,
+            "spiffe_id": agent.spiffe_id,
+            "config_hash": agent.config_hash,
+            "capabilities": json.loads(agent.capabilities),
+            "attestation": (
+                json.loads(agent.attestation_data) if agent.attestation_data else None
+            ),
+            "created_at": agent.created_at,
+            "identity_score": agent.identity_score,
+            "config_score": agent.config_score,
+            "behavior_score": agent.behavior_score,
+            "composite_score": agent.composite_score,
+            "tier": agent.tier,
+            "config_changes": agent.config_changes,
+            "last_config_hash": agent.last_config_hash,
+            "action_count": agent.action_count,
+            "success_count": agent.success_count,
+            "failure_count": agent.failure_count,
+            "violation_count": agent.violation_count,
+            "behavior_weighted": agent.behavior_weighted,
+        }
+
+    async def get_agent(
+        self, agent_id: str, use_cache: bool = True
+    ) -> Optional[Dict[str, Any]]:
+        """Get agent by ID
+
+        use_cache=False forces a database read; score writers need the
+        current aggregates, not a possibly-stale cached row.
+        """
+        cached = self._agent_cache.get(agent_id) if use_cache else None
+        if cached is not None and cached[0] > time.monotonic():
+            # Copy so caller mutations never leak into the cache
+            return dict(cached[1])
 
-    async def get_agent(self, agent_id: str) -> Optional[Dict[str, Any]]:
-        """Get agent by ID"""
         async with self.session() as session:
-            result = await session.execute(select(AgentModel).where(AgentModel.id == agent_id))
+            result = await session.execute(GET_AGENT_STMT, {"agent_id": agent_id})
             agent = result.scalar_one_or_none()
-
-            if agent:
-                return {
-                    "id": agent.id,
-                    "name": agent.name,
-                    "provider": agent.provider,
-                    "spiffe_id": agent.spiffe_id,
-                    "config_hash": agent.config_hash,
-                    "capabilities": json.loads(agent.capabilities),
-                    "attestation": (
-                        json.loads(agent.attestation_data) if agent.attestation_data else None
-                    ),
-                    "created_at": agent.created_at,
-                    "identity_score": agent.identity_score,
-                    "config_score": agent.config_score,
-                    "behavior_score": agent.behavior_score,
-                    "composite_score": agent.composite_score,
-                    "tier": agent.tier,
-                    "config_changes": agent.config_changes,
-                    "last_config_hash": agent.last_config_hash,
-                }
+        if agent is None:
             return None
 
+        agent_dict = self._agent_to_dict(agent)
+        if len(self._agent_cache) >= _AGENT_CACHE_MAX:
+            self._agent_cache.clear()
+        self._agent_cache[agent_id] = (
+            time.monotonic() + _AGENT_CACHE_TTL,
+            dict(agent_dict),
+        )
+        return agent_dict
+
     async def update_agent_scores(
         self,
         agent_id: str,
@@ -236,37 +470,61 @@ class Database:
         behavior: float,
         composite: float,
         tier: int,
+        behavior_state: Optional[Dict[str, Any]] = None,
     ):
-        """Update agent trust scores"""
-        async with self.session() as session:
-            result = await session.execute(select(AgentModel).where(AgentModel.id == agent_id))
-            agent = result.scalar_one_or_none()
+        """Update agent trust scores
+
+        behavior_state, when given, persists the rolling aggregates
+        (action/result counts and decay-weighted sum) alongside the
+        scores in the same UPDATE.
+        """
+        values: Dict[str, Any] = {
+            "identity_score": identity,
+            "config_score": config,
+            "behavior_score": behavior,
+            "composite_score": composite,
+            "tier": tier,
+        }
+        if behavior_state is not None:
+            values.update(
+                action_count=behavior_state["action_count"],
+                success_count=behavior_state["success_count"],
+                failure_count=behavior_state["failure_count"],
+                violation_count=behavior_state["violation_count"],
+                behavior_weighted=behavior_state["behavior_weighted"],
+            )
 
-            if agent:
-                old_tier = agent.tier
-                agent.identity_score = identity
-                agent.config_score = config
-                agent.behavior_score = behavior
-                agent.composite_score = composite
-                agent.tier = tier
+        async with self.session() as session:
+            # Single-column read for the tier-change log, then Core
+            # UPDATE + INSERT — no ORM materialization or change tracking
+            result = await session.execute(
+                select(AgentModel.tier).where(AgentModel.id == agent_id)
+            )
+            old_tier = result.scalar_one_or_none()
+            if old_tier is None:
+                return
 
-                # Record history point
-                history = TrustHistoryModel(
+            await session.execute(
+                update(AgentModel).where(AgentModel.id == agent_id).values(**values)
+            )
+            await session.execute(
+                insert(TrustHistoryModel).values(
                     agent_id=agent_id,
-                    timestamp=datetime.utcnow(),
+                    timestamp=_now_ms(),
                     composite_score=composite,
                     tier=tier,
                     trigger="score_update",
                 )
-                session.add(history)
+            )
 
-                logger.info(
-                    "agent_scores_updated",
-                    agent_id=agent_id,
-                    composite_score=composite,
-                    tier=tier,
-                    tier_changed=(old_tier != tier),
-                )
+        self._agent_cache.pop(agent_id, None)
+        logger.info(
+            "agent_scores_updated",
+            agent_id=agent_id,
+            composite_score=composite,
+            tier=tier,
+            tier_changed=(old_tier != tier),
+        )
 
     async def create_receipt(
         self,
@@ -281,17 +539,18 @@ class Database:
     ):
         """Create action receipt"""
         async with self.session() as session:
-            receipt = ActionReceiptModel(
-                id=receipt_id,
-                agent_id=agent_id,
-                action=action,
-                result=result,
-                timestamp=timestamp,
-                signature=signature,
-                previous_hash=previous_hash,
-                receipt_hash=receipt_hash,
+            await session.execute(
+                insert(ActionReceiptModel).values(
+                    id=receipt_id,
+                    agent_id=agent_id,
+                    action=action,
+                    result=result,
+                    timestamp=_to_ms(timestamp),
+                    signature=signature,
+                    previous_hash=previous_hash,
+                    receipt_hash=receipt_hash,
+                )
             )
-            session.add(receipt)
 
         logger.info(
             "receipt_created",
@@ -301,75 +560,184 @@ class Database:
             result=result,
         )
 
+    async def create_receipts_bulk(self, rows: List[Dict]):
+        """Create many action receipts in one transaction
+
+        Each row carries the same fields as create_receipt. Uses the
+        executemany insert path, so a batch pays one BEGIN/COMMIT cycle
+        instead of one per receipt.
+        """
+        if not rows:
+            return
+        rows = [
+            {**row, "timestamp": _to_ms(row["timestamp"])}
+            if isinstance(row["timestamp"], datetime)
+            else row
+            for row in rows
+        ]
+        async with self.session() as session:
+            await session.execute(insert(ActionReceiptModel), rows)
+
+        logger.info("receipts_created_bulk", count=len(rows), agent_id=rows[0]["agent_id"])
+
     async def get_receipts(self, agent_id: str, limit: Optional[int] = None) -> List[Dict]:
         """Get all receipts for an agent"""
         async with self.session() as session:
-            query = (
-                select(ActionReceiptModel)
-                .where(ActionReceiptModel.agent_id == agent_id)
-                .order_by(ActionReceiptModel.timestamp.desc())
-            )
+            # Column select + mappings() skips ORM instance construction
             if limit:
-                query = query.limit(limit)
-
-            result = await session.execute(query)
-            receipts = result.scalars().all()
-
-            return [
-                {
-                    "id": r.id,
-                    "agent_id": r.agent_id,
-                    "action": r.action,
-                    "result": r.result,
-                    "timestamp": r.timestamp,
-                    "signature": r.signature,
-                    "previous_hash": r.previous_hash,
-                    "receipt_hash": r.receipt_hash,
-                }
-                for r in receipts
-            ]
+                result = await session.execute(
+                    GET_RECEIPTS_LIMIT_STMT, {"agent_id": agent_id, "limit": limit}
+                )
+            else:
+                result = await session.execute(GET_RECEIPTS_STMT, {"agent_id": agent_id})
+            receipts = []
+            for row in result.mappings():
+                r = dict(row)
+                r["action"] = sys.intern(r["action"])
+                r["result"] = sys.intern(r["result"])
+                r["timestamp"] = _from_ms(r["timestamp"])
+                receipts.append(r)
+            return receipts
+
+    async def iter_receipts(self, agent_id: str, batch_size: int = 256):
+        """Lazily yield receipts for an agent, newest first
+
+        Streams rows in server-side batches so callers never hold the
+        whole chain in memory. Opens its own session because streaming
+        responses outlive the request scope.
+        """
+        async with self.async_session() as session:
+            result = await session.stream(
+                GET_RECEIPTS_STMT.execution_options(yield_per=batch_size),
+                {"agent_id": agent_id},
+            )
+            async for row in result.mappings():
+                r = dict(row)
+                r["action"] = sys.intern(r["action"])
+                r["result"] = sys.intern(r["result"])
+                r["timestamp"] = _from_ms(r["timestamp"])
+                yield r
 
     async def get_last_receipt(self, agent_id: str) -> Optional[Dict]:
         """Get last receipt for an agent"""
-        receipts = await self.get_receipts(agent_id, limit=1)
-        return receipts[0] if receipts else None
-
-    async def get_tiers(self) -> List[Dict]:
-        """Get all trust tiers"""
         async with self.session() as session:
-            result = await session.execute(select(TrustTierModel).order_by(TrustTierModel.tier))
-            tiers = result.scalars().all()
-
-            return [
-                {
-                    "tier": t.tier,
-                    "name": t.name,
-                    "min_score": t.min_score,
-                    "max_score": t.max_score,
-                    "description": t.description,
-                    "permissions": json.loads(t.permissions),
-                }
-                for t in tiers
-            ]
+            result = await session.execute(GET_LAST_RECEIPT_STMT, {"agent_id": agent_id})
+            r = result.scalar_one_or_none()
+            if r is None:
+                return None
+            return {
+                "id": r.id,
+                "agent_id": r.agent_id,
+                "action": sys.intern(r.action),
+                "result": sys.intern(r.result),
+                "timestamp": _from_ms(r.timestamp),
+                "signature": r.signature,
+                "previous_hash": r.previous_hash,
+                "receipt_hash": r.receipt_hash,
+            }
 
-    async def get_tier(self, tier_num: int) -> Optional[Dict]:
-        """Get specific tier"""
+    async def get_agent_with_receipts(
+        self, agent_id: str
+    ) -> Tuple[Optional[Dict[str, Any]], List[Dict]]:
+        """Get an agent and its full receipt list on one session
+
+        Serves breakdown-style reads with two prepared statements on a
+        single connection checkout instead of two separate sessions.
+        """
+        async with self.session() as session:
+            result = await session.execute(GET_AGENT_STMT, {"agent_id": agent_id})
+            agent = result.scalar_one_or_none()
+            if agent is None:
+                return None, []
+            agent_dict = self._agent_to_dict(agent)
+
+            result = await session.execute(GET_RECEIPTS_STMT, {"agent_id": agent_id})
+            receipts = []
+            for row in result.mappings():
+                r = dict(row)
+                r["action"] = sys.intern(r["action"])
+                r["result"] = sys.intern(r["result"])
+                r["timestamp"] = _from_ms(r["timestamp"])
+                receipts.append(r)
+            return agent_dict, receipts
+
+    async def get_agents_with_last_receipt(self, agent_ids: List[str]) -> Dict[str, Dict]:
+        """Get the newest receipt for each of the given agents in one query
+
+        Returns {agent_id: receipt_dict}; agents with no receipts are
+        absent. Avoids the N+1 pattern of one get_last_receipt per agent.
+        """
+        if not agent_ids:
+            return {}
+        # Rank with the same timestamp + rowid order as _RECEIPT_ORDER:
+        # batch-recorded receipts share an epoch-ms timestamp, so a
+        # max(timestamp) join alone can return a mid-batch receipt
+        # instead of the chain tail
+        rank = (
+            func.row_number()
+            .over(partition_by=ActionReceiptModel.agent_id, order_by=_RECEIPT_ORDER)
+            .label("rank")
+        )
+        ranked = (
+            select(*_RECEIPT_COLS, rank)
+            .where(ActionReceiptModel.agent_id.in_(agent_ids))
+            .subquery()
+        )
+        query = select(*(ranked.c[col.key] for col in _RECEIPT_COLS)).where(
+            ranked.c.rank == 1
+        )
+        async with self.session() as session:
+            result = await session.execute(query)
+            by_agent: Dict[str, Dict] = {}
+            for row in result.mappings():
+                r = dict(row)
+                r["action"] = sys.intern(r["action"])
+                r["result"] = sys.intern(r["result"])
+                r["timestamp"] = _from_ms(r["timestamp"])
+                by_agent[r["agent_id"]] = r
+            return by_agent
+
+    async def get_last_receipt_hash(self, agent_id: str) -> Optional[str]:
+        """Get just the newest receipt's hash, for hash-chain linking"""
         async with self.session() as session:
             result = await session.execute(
-                select(TrustTierModel).where(TrustTierModel.tier == tier_num)
+                GET_LAST_RECEIPT_HASH_STMT, {"agent_id": agent_id}
             )
-            tier = result.scalar_one_or_none()
+            return result.scalar_one_or_none()
+
+    async def _load_tier_cache(self) -> Dict[int, Dict]:
+        """Populate the tier cache from the database if it is cold"""
+        if self._tier_cache is not None:
+            return self._tier_cache
+        async with self._tier_cache_lock:
+            if self._tier_cache is None:
+                async with self.session() as session:
+                    result = await session.execute(
+                        select(TrustTierModel).order_by(TrustTierModel.tier)
+                    )
+                    self._tier_cache = {
+                        t.tier: {
+                            "tier": t.tier,
+                            "name": t.name,
+                            "min_score": t.min_score,
+                            "max_score": t.max_score,
+                            "description": t.description,
+                            "permissions": json.loads(t.permissions),
+                        }
+                        for t in result.scalars()
+                    }
+            return self._tier_cache
 
-            if tier:
-                return {
-                    "tier": tier.tier,
-                    "name": tier.name,
-                    "min_score": tier.min_score,
-                    "max_score": tier.max_score,
-                    "description": tier.description,
-                    "permissions": json.loads(tier.permissions),
-                }
-            return None
+    async def get_tiers(self) -> List[Dict]:
+        """Get all trust tiers"""
+        cache = await self._load_tier_cache()
+        return [dict(t) for t in cache.values()]
+
+    async def get_tier(self, tier_num: int) -> Optional[Dict]:
+        """Get specific tier"""
+        cache = await self._load_tier_cache()
+        tier = cache.get(tier_num)
+        return dict(tier) if tier else None
 
     async def update_tier(
         self,
@@ -396,118 +764,138 @@ class Database:
 
                 logger.info("tier_updated", tier=tier_num, name=name)
 
+        self._tier_cache = None
+
     async def get_trust_history(
         self, agent_id: str, limit: Optional[int] = 100
     ) -> List[Dict]:
         """Get trust history for an agent"""
         async with self.session() as session:
-            query = (
-                select(TrustHistoryModel)
-                .where(TrustHistoryModel.agent_id == agent_id)
-                .order_by(TrustHistoryModel.timestamp.desc())
-                .limit(limit)
+            result = await session.execute(
+                GET_TRUST_HISTORY_STMT, {"agent_id": agent_id, "limit": limit}
+            )
+            history = []
+            for row in result.mappings():
+                h = dict(row)
+                h["timestamp"] = _from_ms(h["timestamp"])
+                history.append(h)
+            return history
+
+    async def prune_trust_history(self, max_age_days: int = 90) -> int:
+        """Delete trust-history rows older than max_age_days
+
+        Keeps the hot table small so its B-tree stays shallow and the
+        page cache holds live rows. Returns the number of rows deleted.
+        """
+        cutoff = _now_ms() - max_age_days * 24 * 60 * 60 * 1000
+        async with self.session() as session:
+            result = await session.execute(
+                delete(TrustHistoryModel).where(TrustHistoryModel.timestamp < cutoff)
             )
+            deleted = result.rowcount or 0
 
-            result = await session.execute(query)
-            history = result.scalars().all()
-
-            return [
-                {
-                    "timestamp": h.timestamp,
-                    "composite_score": h.composite_score,
-                    "tier": h.tier,
-                    "trigger": h.trigger,
-                }
-                for h in history
-            ]
+        if deleted:
+            logger.info("trust_history_pruned", deleted=deleted, max_age_days=max_age_days)
+        return deleted
 
     async def create_webhook(
         self, webhook_id: str, url: str, events: List[str], secret: Optional[str]
     ):
         """Create webhook configuration"""
         async with self.session() as session:
-            webhook = WebhookConfigModel(
-                id=webhook_id,
-                url=url,
-                events=json.dumps(events),
-                secret=secret,
-                enabled=True,
-                created_at=datetime.utcnow(),
+            await session.execute(
+                insert(WebhookConfigModel).values(
+                    id=webhook_id,
+                    url=url,
+                    events=json.dumps(events),
+                    secret=secret,
+                    enabled=True,
+                    created_at=datetime.utcnow(),
+                )
             )
-            session.add(webhook)
 
         logger.info("webhook_created", webhook_id=webhook_id, url=url)
 
     async def get_webhooks(self) -> List[Dict]:
         """Get all webhook configurations"""
         async with self.session() as session:
-            result = await session.execute(select(WebhookConfigModel))
-            webhooks = result.scalars().all()
-
-            return [
-                {
-                    "id": w.id,
-                    "url": w.url,
-                    "events": json.loads(w.events),
-                    "secret": w.secret,
-                    "enabled": w.enabled,
-                    "created_at": w.created_at,
-                }
-                for w in webhooks
-            ]
-
-    async def get_stats(self) -> Dict:
-        """Get dashboard statistics"""
-        async with self.session() as session:
-            # Total agents
-            total_agents_result = await session.execute(
-                select(func.count()).select_from(AgentModel)
+            result = await session.execute(
+                select(
+                    WebhookConfigModel.id,
+                    WebhookConfigModel.url,
+                    WebhookConfigModel.events,
+                    WebhookConfigModel.secret,
+                    WebhookConfigModel.enabled,
+                    WebhookConfigModel.created_at,
+                )
             )
-            total_agents = total_agents_result.scalar()
 
-            # Total actions
-            total_actions_result = await session.execute(
-                select(func.count()).select_from(ActionReceiptModel)
-            )
-            total_actions = total_actions_result.scalar()
+            webhooks = []
+            for row in result.mappings():
+                w = dict(row)
+                w["events"] = json.loads(w["events"])
+                webhooks.append(w)
+            return webhooks
 
-            # Agents by tier
-            agents_by_tier_result = await session.execute(
-                select(AgentModel.tier, func.count()).group_by(AgentModel.tier)
-            )
-            agents_by_tier = {str(tier): count for tier, count in agents_by_tier_result}
+    async def _scalar(self, query) -> Any:
+        """Run a single scalar query on its own pooled session
 
-            # Recent actions (last 24 hours)
-            from datetime import timedelta
+        Bypasses any request_scope session on purpose: these helpers run
+        under asyncio.gather and must not share one AsyncSession.
+        """
+        async with self.async_session() as session:
+            result = await session.execute(query)
+            return result.scalar()
 
-            recent_cutoff = datetime.utcnow() - timedelta(days=1)
-            recent_actions_result = await session.execute(
-                select(func.count())
-                .select_from(ActionReceiptModel)
-                .where(ActionReceiptModel.timestamp > recent_cutoff)
+    async def _agents_by_tier(self) -> Dict[str, int]:
+        async with self.async_session() as session:
+            result = await session.execute(
+                select(AgentModel.tier, func.count()).group_by(AgentModel.tier)
             )
-            recent_actions = recent_actions_result.scalar()
-
-            # Trust score distribution
-            # SQLite doesn't support CASE in same way, so we'll do it in Python
-            agents_result = await session.execute(select(AgentModel.composite_score))
-            scores = agents_result.scalars().all()
-
+            return {str(tier): count for tier, count in result}
+
+    async def _score_distribution(self) -> Dict[str, int]:
+        # Bucketed in SQL so only 4 rows come back
+        bucket = case(
+            (AgentModel.composite_score < 0.2, "0.0-0.2"),
+            (AgentModel.composite_score < 0.5, "0.2-0.5"),
+            (AgentModel.composite_score < 0.8, "0.5-0.8"),
+            else_="0.8-1.0",
+        ).label("range")
+        async with self.async_session() as session:
+            result = await session.execute(select(bucket, func.count()).group_by(bucket))
             distribution = {"0.0-0.2": 0, "0.2-0.5": 0, "0.5-0.8": 0, "0.8-1.0": 0}
-            for score in scores:
-                if score < 0.2:
-                    distribution["0.0-0.2"] += 1
-                elif score < 0.5:
-                    distribution["0.2-0.5"] += 1
-                elif score < 0.8:
-                    distribution["0.5-0.8"] += 1
-                else:
-                    distribution["0.8-1.0"] += 1
+            for bucket_range, count in result:
+                distribution[bucket_range] = count
+            return distribution
 
-            return {
-                "total_agents": total_agents,
-                "total_actions": total_actions,
-                "agents_by_tier": agents_by_tier,
-                "recent_actions": recent_actions,
-                "trust_score_distribution": distribution,
-            }
+    async def get_stats(self) -> Dict:
+        """Get dashboard statistics
+
+        The five sub-queries are independent, so each runs on its own
+        pooled session and they execute concurrently. SQLite serializes
+        at the file level, but driver round-trips and row
+        materialization still overlap.
+        """
+        recent_cutoff = _now_ms() - 24 * 60 * 60 * 1000
+        total_agents, total_actions, recent_actions, agents_by_tier, distribution = (
+            await asyncio.gather(
+                self._scalar(select(func.count()).select_from(AgentModel)),
+                self._scalar(select(func.count()).select_from(ActionReceiptModel)),
+                self._scalar(
+                    select(func.count())
+                    .select_from(ActionReceiptModel)
+                    .where(ActionReceiptModel.timestamp > recent_cutoff)
+                ),
+                self._agents_by_tier(),
+                self._score_distribution(),
+            )
+        )
+
+        return {
+            "total_agents": total_agents,
+            "total_actions": total_actions,
+            "agents_by_tier": agents_by_tier,
+            "recent_actions": recent_actions,
+            "trust_score_distribution": distribution,
+        }
@@ -0,0 +1,31 @@
+"""
+Trust Gateway ID Generation
+Time-ordered UUIDv7 identifiers with pooled randomness
+"""
+import os
+import time
+import uuid
+
+# Refill entropy in one urandom read instead of a syscall per ID
+_POOL_BYTES = 10 * 1024
+_pool = b""
+_pos = _POOL_BYTES
+
+
+def uuid7() -> str:
+    """Generate a UUIDv7 string (48-bit epoch-ms prefix + 74 random bits)
+
+    Time-ordered prefixes keep primary-key inserts appending at the
+    right edge of the B-tree instead of splitting random pages.
+    """
+    global _pool, _pos
+    if _pos + 10 > len(_pool):
+        _pool = os.urandom(_POOL_BYTES)
+        _pos = 0
+    rand = _pool[_pos : _pos + 10]
+    _pos += 10
+
+    raw = bytearray((time.time_ns() // 1_000_000).to_bytes(6, "big") + rand)
+    raw[6] = (raw[6] & 0x0F) | 0x70  # version 7
+    raw[8] = (raw[8] & 0x3F) | 0x80  # RFC 4122 variant
+    return str(uuid.UUID(bytes=bytes(raw)))
@@ -1,14 +1,31 @@
 """Trust Gateway V2 FastAPI application - Async + SPIFFE + JWT + A2A + WebSocket"""
+import hashlib
+import hmac
+import logging
 import os
-import uuid
+import queue
+import time
 import asyncio
-from datetime import datetime
-from typing import List, Optional, Set
+from logging.handlers import QueueHandler, QueueListener
+from datetime import datetime, timezone
+from typing import Annotated, List, Optional, Set
 from contextlib import asynccontextmanager
+from types import MappingProxyType
 
 import httpx
+import orjson
 import structlog
-from fastapi import FastAPI, HTTPException, Header, Depends, WebSocket, WebSocketDisconnect
+from fastapi import (
+    FastAPI,
+    HTTPException,
+    Header,
+    Depends,
+    BackgroundTasks,
+    WebSocket,
+    WebSocketDisconnect,
+)
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse, ORJSONResponse, Response, StreamingResponse
 from fastapi.middleware.cors import CORSMiddleware
 from opentelemetry import trace
 from opentelemetry.sdk.trace import TracerProvider
@@ -36,23 +53,44 @@ from .models import (
     WebSocketMessage,
 )
 from .database import Database
+from .ids import uuid7
 from .trust_engine import TrustEngine
 
-# Configure structlog
+# Configure logging: handlers hang off a queue so formatting and the
+# stderr write happen on the listener thread, not the event loop
+_log_queue: queue.SimpleQueue = queue.SimpleQueue()
+_log_listener = QueueListener(_log_queue, logging.StreamHandler())
+_log_listener.start()
+_root_logger = logging.getLogger()
+_root_logger.addHandler(QueueHandler(_log_queue))
+_root_logger.setLevel(logging.INFO)
+
 structlog.configure(
     processors=[
         structlog.processors.TimeStamper(fmt="iso"),
         structlog.processors.JSONRenderer(),
     ],
     context_class=dict,
-    logger_factory=structlog.PrintLoggerFactory(),
+    logger_factory=structlog.stdlib.LoggerFactory(),
 )
 
 logger = structlog.get_logger()
 
-# Configure OpenTelemetry
-trace.set_tracer_provider(TracerProvider())
-trace.get_tracer_provider().add_span_processor(BatchSpanProcessor(ConsoleSpanExporter()))
+# Configure OpenTelemetry. Spans only leave the process when a collector
+# is configured; the previous ConsoleSpanExporter serialized every span
+# to stdout under a lock, taxing each traced request. OTEL_DEBUG_CONSOLE
+# restores console spans for local debugging.
+_otlp_endpoint = os.getenv("OTLP_ENDPOINT")
+if _otlp_endpoint:
+    from opentelemetry.exporter.otlp.proto.grpc.trace_exporter import OTLPSpanExporter
+
+    _provider = TracerProvider()
+    _provider.add_span_processor(BatchSpanProcessor(OTLPSpanExporter(endpoint=_otlp_endpoint)))
+    trace.set_tracer_provider(_provider)
+elif os.getenv("OTEL_DEBUG_CONSOLE"):
+    _provider = TracerProvider()
+    _provider.add_span_processor(BatchSpanProcessor(ConsoleSpanExporter()))
+    trace.set_tracer_provider(_provider)
 tracer = trace.get_tracer(__name__)
 
 # Environment configuration
@@ -60,32 +98,97 @@ DB_PATH = os.getenv("DB_PATH", "sqlite+aiosqlite:///trust_gateway.db")
 SECRET_KEY = os.getenv("SECRET_KEY", "trust-gateway-secret-key-change-in-production")
 JWT_SECRET = os.getenv("JWT_SECRET", SECRET_KEY)
 API_KEY = os.getenv("API_KEY", "dev-api-key-change-in-production")
+API_KEY_BYTES = API_KEY.encode()
 
 # Global components
 db: Database
 trust_engine: TrustEngine
+http_client: httpx.AsyncClient
 websocket_connections: Set[WebSocket] = set()
+# Immutable snapshot rebuilt only on connect/disconnect; broadcasts read
+# it directly instead of copying the set per message
+_ws_snapshot: tuple = ()
+
+
+def _ws_register(ws: WebSocket):
+    global _ws_snapshot
+    websocket_connections.add(ws)
+    _ws_snapshot = tuple(websocket_connections)
+
+
+def _ws_unregister(ws: WebSocket):
+    global _ws_snapshot
+    websocket_connections.discard(ws)
+    _ws_snapshot = tuple(websocket_connections)
+
+# Pre-serialized /tiers response and its ETag, invalidated on tier update
+_tiers_response_cache: Optional[bytes] = None
+_tiers_etag: Optional[str] = None
+
+# Action → (required_tier, required_score) policy map, built once at import.
+# MappingProxyType keeps handlers from mutating it.
+ACTION_POLICIES = MappingProxyType({
+    "read_config": (0, 0.0),
+    "view_status": (0, 0.0),
+    "send_notification": (1, 0.2),
+    "read_data": (1, 0.2),
+    "write_data": (2, 0.5),
+    "call_api": (2, 0.5),
+    "send_email": (2, 0.5),
+    "delete_data": (3, 0.8),
+    "delete_database": (3, 0.9),
+    "admin_action": (3, 0.85),
+})
+
+# Default policy for unknown actions
+DEFAULT_POLICY = (1, 0.3)
+
+
+async def _prune_history_periodically(interval_seconds: float = 6 * 60 * 60):
+    """Periodically trim old trust-history rows off the hot table"""
+    while True:
+        await asyncio.sleep(interval_seconds)
+        try:
+            await db.prune_trust_history()
+        except Exception as e:
+            logger.warning("trust_history_prune_failed", error=str(e))
 
 
 # Lifespan context manager for startup/shutdown
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Lifespan context manager"""
-    global db, trust_engine
+    global db, trust_engine, http_client
 
     # Startup
     logger.info("trust_gateway_starting", version="2.0.0")
     db = Database(DB_PATH)
     await db.init_db()
     trust_engine = TrustEngine(SECRET_KEY, JWT_SECRET)
+    # One shared client so webhook deliveries reuse pooled keep-alive
+    # connections instead of paying a TCP+TLS handshake per event
+    http_client = httpx.AsyncClient(
+        timeout=10.0,
+        limits=httpx.Limits(max_keepalive_connections=100, max_connections=200),
+    )
+    # Prewarm the tier cache so the first register/authorize request
+    # does not pay the initial tier-table round trip, and install the
+    # table on the engine for table-free tier lookups.
+    trust_engine.set_tiers(await db.get_tiers())
+    prune_task = asyncio.create_task(_prune_history_periodically())
+    webhook_workers = [asyncio.create_task(_webhook_worker()) for _ in range(4)]
     logger.info("trust_gateway_started", db_path=DB_PATH)
 
     yield
 
     # Shutdown
     logger.info("trust_gateway_stopping")
+    prune_task.cancel()
+    for worker in webhook_workers:
+        worker.cancel()
+    await http_client.aclose()
     # Close websocket connections
-    for ws in list(websocket_connections):
+    for ws in _ws_snapshot:
         await ws.close()
     logger.info("trust_gateway_stopped")
 
@@ -96,6 +199,7 @@ app = FastAPI(
     description="AI Agent Trust Scoring with SPIFFE Identity, JWT Tokens, and A2A Compatibility",
     version="2.0.0",
     lifespan=lifespan,
+    default_response_class=ORJSONResponse,
 )
 
 # CORS
@@ -108,60 +212,106 @@ app.add_middleware(
 )
 
 # Instrument FastAPI with OpenTelemetry
-FastAPIInstrumentor.instrument_app(app)
+# Skip spans for the health probe and the WebSocket keepalive loop
+FastAPIInstrumentor.instrument_app(app, excluded_urls="health,ws/dashboard")
+
+
+@app.middleware("http")
+async def db_request_scope(request, call_next):
+    """Share one database session/transaction per HTTP request"""
+    async with db.request_scope():
+        return await call_next(request)
 
 
 # Dependencies
 def verify_api_key(x_api_key: str = Header(...)):
     """Verify API key authentication"""
-    if x_api_key != API_KEY:
+    # Constant-time compare; a plain != leaks key prefix length via timing
+    if not hmac.compare_digest(x_api_key.encode(), API_KEY_BYTES):
         logger.warning("invalid_api_key_attempt")
         raise HTTPException(status_code=401, detail="Invalid API key")
     return x_api_key
 
 
+# Shared Annotated alias: one dependency cache entry per request
+ApiKeyDep = Annotated[str, Depends(verify_api_key)]
+
+
 async def broadcast_websocket(message: WebSocketMessage):
     """Broadcast message to all WebSocket clients"""
-    for ws in list(websocket_connections):
-        try:
-            await ws.send_json(message.model_dump(mode="json"))
-        except Exception as e:
-            logger.error("websocket_broadcast_error", error=str(e))
-            websocket_connections.discard(ws)
+    clients = _ws_snapshot
+    if not clients:
+        return
+
+    # Serialize once for every client; send_json would re-encode per call
+    payload = orjson.dumps(message.model_dump(mode="json")).decode()
+    results = await asyncio.gather(
+        *(ws.send_text(payload) for ws in clients), return_exceptions=True
+    )
+    for ws, outcome in zip(clients, results):
+        if isinstance(outcome, Exception):
+            logger.error("websocket_broadcast_error", error=str(outcome))
+            _ws_unregister(ws)
 
 
-async def trigger_webhooks(event: WebhookEvent, data: dict):
-    """Trigger webhooks for an event"""
-    webhooks = await db.get_webhooks()
+# Delivery queue so request handlers never wait on subscriber endpoints;
+# workers drain it in the background
+_webhook_queue: asyncio.Queue = asyncio.Queue(maxsize=10_000)
+
 
-    for webhook in webhooks:
-        if not webhook["enabled"]:
-            continue
+def queue_webhooks(event: WebhookEvent, data: dict):
+    """Queue a webhook event for background delivery"""
+    try:
+        _webhook_queue.put_nowait((event, data))
+    except asyncio.QueueFull:
+        logger.error("webhook_queue_full", event=event.value)
 
-        if event.value not in webhook["events"]:
-            continue
 
+async def _webhook_worker():
+    """Drain the webhook queue, delivering one event at a time"""
+    while True:
+        event, data = await _webhook_queue.get()
         try:
-            async with httpx.AsyncClient() as client:
-                payload = {"event": event.value, "timestamp": datetime.utcnow().isoformat(), "data": data}
-                
-                headers = {}
-                if webhook["secret"]:
-                    # Sign webhook with HMAC
-                    import hmac
-                    import hashlib
-                    import json
-                    signature = hmac.new(
-                        webhook["secret"].encode(),
-                        json.dumps(payload).encode(),
-                        hashlib.sha256
-                    ).hexdigest()
-                    headers["X-Webhook-Signature"] = signature
-
-                await client.post(webhook["url"], json=payload, headers=headers, timeout=10.0)
-                logger.info("webhook_triggered", url=webhook["url"], event=event.value)
+            await trigger_webhooks(event, data)
         except Exception as e:
-            logger.error("webhook_error", url=webhook["url"], error=str(e))
+            logger.error("webhook_delivery_failed", event=event.value, error=str(e))
+        finally:
+            _webhook_queue.task_done()
+
+
+async def trigger_webhooks(event: WebhookEvent, data: dict):
+    """Trigger webhooks for an event"""
+    webhooks = await db.get_webhooks()
+    recipients = [
+        w for w in webhooks if w["enabled"] and event.value in w["events"]
+    ]
+    if not recipients:
+        return
+
+    payload = {"event": event.value, "timestamp": datetime.utcnow().isoformat(), "data": data}
+    # Identical for every subscriber: serialize once, sign and send the
+    # same bytes so HMAC verification on the receiving end always matches
+    body = orjson.dumps(payload)
+
+    async def _send(webhook: dict):
+        headers = {"Content-Type": "application/json"}
+        if webhook["secret"]:
+            signature = hmac.new(
+                webhook["secret"].encode(), body, hashlib.sha256
+            ).hexdigest()
+            headers["X-Webhook-Signature"] = signature
+
+        await http_client.post(webhook["url"], content=body, headers=headers)
+        logger.info("webhook_triggered", url=webhook["url"], event=event.value)
+
+    # Deliveries are independent network I/O; overlap them so fan-out
+    # takes as long as the slowest webhook, not the sum of all of them
+    results = await asyncio.gather(
+        *(_send(w) for w in recipients), return_exceptions=True
+    )
+    for webhook, outcome in zip(recipients, results):
+        if isinstance(outcome, Exception):
+            logger.error("webhook_error", url=webhook["url"], error=str(outcome))
 
 
 # Endpoints
@@ -172,10 +322,10 @@ async def health_check():
 
 
 @app.post("/agents/register", response_model=Agent)
-async def register_agent(registration: AgentRegistration, api_key: str = Depends(verify_api_key)):
+async def register_agent(registration: AgentRegistration, api_key: ApiKeyDep):
     """Register a new agent with SPIFFE-compatible identity attestation"""
     with tracer.start_as_current_span("register_agent"):
-        agent_id = str(uuid.uuid4())
+        agent_id = uuid7()
 
         # Create agent
         agent_data = await db.create_agent(
@@ -188,18 +338,16 @@ async def register_agent(registration: AgentRegistration, api_key: str = Depends
             attestation=registration.attestation.model_dump() if registration.attestation else None,
         )
 
-        # Calculate initial scores
-        identity_score, _ = trust_engine.calculate_identity_score(agent_data)
-        config_score, _ = trust_engine.calculate_config_score(agent_data)
-        behavior_score = 0.0
+        # Calculate initial scores (no receipts yet)
+        identity_score, config_score, behavior_score, composite = trust_engine.recompute_scores(
+            agent_data, []
+        )
 
         # Composite with Sybil resistance
-        composite = trust_engine.calculate_composite_score(identity_score, config_score, behavior_score)
         composite = max(0.1, composite)
 
         # Determine tier
-        tiers = await db.get_tiers()
-        tier = trust_engine.determine_tier(composite, tiers)
+        tier = trust_engine.determine_tier(composite)
 
         # Update scores
         await db.update_agent_scores(agent_id, identity_score, config_score, behavior_score, composite, tier)
@@ -215,34 +363,66 @@ async def register_agent(registration: AgentRegistration, api_key: str = Depends
 
         logger.info("agent_registered", agent_id=agent_id, name=registration.name, tier=tier)
 
-        agent_data = await db.get_agent(agent_id)
+        # Fold the computed scores into the row returned by create_agent
+        # instead of re-reading the agent
+        agent_data.update(
+            identity_score=identity_score,
+            config_score=config_score,
+            behavior_score=behavior_score,
+            composite_score=composite,
+            tier=tier,
+        )
         return Agent(**agent_data)
 
 
+def _agent_etag(agent: dict) -> str:
+    """Weak validator over the fields that change when trust changes"""
+    key = (
+        f"{agent['composite_score']}:{agent['tier']}:{agent['behavior_score']}:"
+        f"{agent['config_changes']}"
+    )
+    return f'"{hashlib.blake2b(key.encode(), digest_size=8).hexdigest()}"'
+
+
 @app.get("/agents/{agent_id}", response_model=Agent)
-async def get_agent(agent_id: str, api_key: str = Depends(verify_api_key)):
+async def get_agent(
+    agent_id: str,
+    api_key: ApiKeyDep,
+    if_none_match: Optional[str] = Header(None),
+):
     """Get agent profile and current trust score"""
     with tracer.start_as_current_span("get_agent"):
         agent = await db.get_agent(agent_id)
         if not agent:
             raise HTTPException(status_code=404, detail="Agent not found")
-        return Agent(**agent)
+
+        # Polling dashboards can skip body transfer when nothing changed
+        etag = _agent_etag(agent)
+        if if_none_match == etag:
+            return Response(status_code=304)
+        return JSONResponse(content=jsonable_encoder(Agent(**agent)), headers={"ETag": etag})
 
 
 @app.get("/agents/{agent_id}/trust", response_model=TrustBreakdown)
-async def get_trust_breakdown(agent_id: str, api_key: str = Depends(verify_api_key)):
+async def get_trust_breakdown(
+    agent_id: str, api_key: ApiKeyDep, recompute: bool = False
+):
     """Get detailed trust score breakdown"""
     with tracer.start_as_current_span("get_trust_breakdown"):
-        agent = await db.get_agent(agent_id)
+        agent, receipts = await db.get_agent_with_receipts(agent_id)
         if not agent:
             raise HTTPException(status_code=404, detail="Agent not found")
 
-        receipts = await db.get_receipts(agent_id)
-
-        # Recalculate scores for detailed breakdown
+        # Factors always come from a fresh pass (they are the payload of
+        # this endpoint), but by default the scores themselves are the
+        # persisted ones the composite was actually built from.
         identity_score, identity_factors = trust_engine.calculate_identity_score(agent)
         config_score, config_factors = trust_engine.calculate_config_score(agent)
         behavior_score, behavior_factors = trust_engine.calculate_behavior_score(receipts)
+        if not recompute:
+            identity_score = agent["identity_score"]
+            config_score = agent["config_score"]
+            behavior_score = agent["behavior_score"]
 
         # Get tier info
         tier_data = await db.get_tier(agent["tier"])
@@ -265,7 +445,7 @@ async def get_trust_breakdown(agent_id: str, api_key: str = Depends(verify_api_k
 
 
 @app.get("/agents/{agent_id}/history", response_model=TrustHistory)
-async def get_trust_history(agent_id: str, limit: int = 100, api_key: str = Depends(verify_api_key)):
+async def get_trust_history(agent_id: str, api_key: ApiKeyDep, limit: int = 100):
     """Get trust score history for an agent"""
     with tracer.start_as_current_span("get_trust_history"):
         agent = await db.get_agent(agent_id)
@@ -274,14 +454,16 @@ async def get_trust_history(agent_id: str, limit: int = 100, api_key: str = Depe
 
         history = await db.get_trust_history(agent_id, limit=limit)
         
+        # model_construct skips re-validating rows the DB schema already
+        # constrains; history can be hundreds of points per call
         return TrustHistory(
             agent_id=agent_id,
-            history=[TrustHistoryPoint(**h) for h in history],
+            history=[TrustHistoryPoint.model_construct(**h) for h in history],
         )
 
 
 @app.get("/agents/{agent_id}/card", response_model=AgentCard)
-async def get_agent_card(agent_id: str, api_key: str = Depends(verify_api_key)):
+async def get_agent_card(agent_id: str, api_key: ApiKeyDep):
     """Get A2A-compatible agent capability card"""
     with tracer.start_as_current_span("get_agent_card"):
         agent = await db.get_agent(agent_id)
@@ -299,9 +481,8 @@ async def get_agent_card(agent_id: str, api_key: str = Depends(verify_api_key)):
         # Get last action timestamp
         last_action_at = receipts[0]["timestamp"] if receipts else None
 
-        # Get permitted actions
-        tiers = await db.get_tiers()
-        permitted_actions = trust_engine.get_permitted_actions_for_tier(agent["tier"], tiers)
+        # Permitted actions come from the table installed on the engine
+        permitted_actions = trust_engine.get_permitted_actions_for_tier(agent["tier"])
 
         return AgentCard(
             agent_id=agent_id,
@@ -322,16 +503,15 @@ async def get_agent_card(agent_id: str, api_key: str = Depends(verify_api_key)):
 
 
 @app.post("/agents/{agent_id}/token", response_model=JWTTokenResponse)
-async def issue_token(agent_id: str, expires_in: int = 3600, api_key: str = Depends(verify_api_key)):
+async def issue_token(agent_id: str, api_key: ApiKeyDep, expires_in: int = 3600):
     """Issue JWT token based on agent's current trust tier"""
     with tracer.start_as_current_span("issue_token"):
         agent = await db.get_agent(agent_id)
         if not agent:
             raise HTTPException(status_code=404, detail="Agent not found")
 
-        # Get permitted actions for tier
-        tiers = await db.get_tiers()
-        permitted_actions = trust_engine.get_permitted_actions_for_tier(agent["tier"], tiers)
+        # Permitted actions come from the table installed on the engine
+        permitted_actions = trust_engine.get_permitted_actions_for_tier(agent["tier"])
 
         # Issue JWT token
         token = trust_engine.issue_jwt_token(
@@ -353,8 +533,85 @@ async def issue_token(agent_id: str, expires_in: int = 3600, api_key: str = Depe
         )
 
 
+# Per-agent locks so bursts of recomputes for one agent run serialized
+_score_recompute_locks: dict = {}
+
+
+async def _recompute_agent_scores(
+    agent_id: str, action: str, result: str, results: Optional[List[str]] = None
+):
+    """Recompute trust scores for an agent after recorded actions
+
+    Runs as a background task once the receipt response has been sent;
+    opens its own database scope since the request's is already closed.
+    Behavior updates fold the new results into the agent row's rolling
+    aggregates in O(1) instead of rescanning the receipt chain.
+    """
+    if len(_score_recompute_locks) > 4096:
+        # Evict only idle entries: dropping a held lock would hand a second
+        # recompute for the same agent a fresh lock, letting the two
+        # read-modify-write passes interleave and lose aggregate updates
+        for key in [k for k, v in _score_recompute_locks.items() if not v.locked()]:
+            del _score_recompute_locks[key]
+    lock = _score_recompute_locks.setdefault(agent_id, asyncio.Lock())
+    async with lock:
+        async with db.request_scope():
+            # Fresh read: the aggregates being folded into must be current
+            agent = await db.get_agent(agent_id, use_cache=False)
+            if not agent:
+                return
+            identity_score = trust_engine._identity_score_fast(agent)
+            config_score, _ = trust_engine.calculate_config_score(agent)
+            behavior_score, behavior_state = trust_engine.update_behavior_incrementally(
+                agent, results or [result]
+            )
+            composite = max(
+                0.1,
+                trust_engine.calculate_composite_score(
+                    identity_score, config_score, behavior_score
+                ),
+            )
+
+            old_tier = agent["tier"]
+            tier = trust_engine.determine_tier(composite)
+
+            await db.update_agent_scores(
+                agent_id,
+                identity_score,
+                config_score,
+                behavior_score,
+                composite,
+                tier,
+                behavior_state=behavior_state,
+            )
+
+    # Broadcast to WebSocket
+    await broadcast_websocket(
+        WebSocketMessage(
+            type="receipt_recorded",
+            timestamp=datetime.utcnow(),
+            data={
+                "agent_id": agent_id,
+                "action": action,
+                "result": result,
+                "new_score": composite,
+                "new_tier": tier,
+            },
+        )
+    )
+
+    # Trigger webhooks
+    if old_tier != tier:
+        queue_webhooks(
+            WebhookEvent.TIER_CHANGED,
+            {"agent_id": agent_id, "old_tier": old_tier, "new_tier": tier, "score": composite},
+        )
+
+
 @app.post("/actions/record", response_model=ActionReceipt)
-async def record_action(record: ActionRecord, api_key: str = Depends(verify_api_key)):
+async def record_action(
+    record: ActionRecord, background: BackgroundTasks, api_key: ApiKeyDep
+):
     """Record a signed action receipt"""
     with tracer.start_as_current_span("record_action"):
         agent = await db.get_agent(record.agent_id)
@@ -362,11 +619,15 @@ async def record_action(record: ActionRecord, api_key: str = Depends(verify_api_
             raise HTTPException(status_code=404, detail="Agent not found")
 
         timestamp = record.timestamp or datetime.utcnow()
-        receipt_id = str(uuid.uuid4())
+        # Receipts persist epoch-ms; normalize to naive-UTC millisecond
+        # precision before signing so stored rows verify bit-for-bit.
+        if timestamp.tzinfo is not None:
+            timestamp = timestamp.astimezone(timezone.utc).replace(tzinfo=None)
+        timestamp = timestamp.replace(microsecond=timestamp.microsecond // 1000 * 1000)
+        receipt_id = uuid7()
 
-        # Get previous receipt for chaining
-        last_receipt = await db.get_last_receipt(record.agent_id)
-        previous_hash = last_receipt["receipt_hash"] if last_receipt else None
+        # Get previous receipt hash for chaining
+        previous_hash = await db.get_last_receipt_hash(record.agent_id)
 
         # Sign receipt
         signature = trust_engine.sign_receipt(
@@ -388,45 +649,14 @@ async def record_action(record: ActionRecord, api_key: str = Depends(verify_api_
             receipt_hash=receipt_hash,
         )
 
-        # Recalculate trust scores
-        receipts = await db.get_receipts(record.agent_id)
-        identity_score, _ = trust_engine.calculate_identity_score(agent)
-        config_score, _ = trust_engine.calculate_config_score(agent)
-        behavior_score, _ = trust_engine.calculate_behavior_score(receipts)
-
-        composite = trust_engine.calculate_composite_score(identity_score, config_score, behavior_score)
-        composite = max(0.1, composite)
-
-        old_tier = agent["tier"]
-        tiers = await db.get_tiers()
-        tier = trust_engine.determine_tier(composite, tiers)
-
-        await db.update_agent_scores(record.agent_id, identity_score, config_score, behavior_score, composite, tier)
-
-        # Broadcast to WebSocket
-        await broadcast_websocket(
-            WebSocketMessage(
-                type="receipt_recorded",
-                timestamp=datetime.utcnow(),
-                data={
-                    "agent_id": record.agent_id,
-                    "action": record.action,
-                    "result": record.result,
-                    "new_score": composite,
-                    "new_tier": tier,
-                },
-            )
+        # Recalculate trust scores after the response is sent; the POST
+        # only pays for the chain read, one signature, and one INSERT
+        background.add_task(
+            _recompute_agent_scores, record.agent_id, record.action, record.result
         )
 
-        # Trigger webhooks
-        if old_tier != tier:
-            await trigger_webhooks(
-                WebhookEvent.TIER_CHANGED,
-                {"agent_id": record.agent_id, "old_tier": old_tier, "new_tier": tier, "score": composite},
-            )
-
         if record.result == "violation":
-            await trigger_webhooks(
+            queue_webhooks(
                 WebhookEvent.AUTHORIZATION_DENIED,
                 {"agent_id": record.agent_id, "action": record.action, "reason": "violation"},
             )
@@ -445,30 +675,93 @@ async def record_action(record: ActionRecord, api_key: str = Depends(verify_api_
         )
 
 
+@app.post("/actions/record/batch", response_model=List[ActionReceipt])
+async def record_actions_batch(
+    records: List[ActionRecord], background: BackgroundTasks, api_key: ApiKeyDep
+):
+    """Record many signed action receipts in one request
+
+    Each agent's chain tail is read once, signatures are chained
+    in-memory, and all receipts land in a single bulk insert — one
+    transaction instead of one per action. Scores recompute once per
+    agent in the background.
+    """
+    with tracer.start_as_current_span("record_actions_batch"):
+        if not records:
+            return []
+
+        # Group per agent so each chain is extended exactly once
+        by_agent: dict = {}
+        for record in records:
+            by_agent.setdefault(record.agent_id, []).append(record)
+
+        # One timestamp for the whole batch: the records are one logical
+        # event, and this avoids a clock read per receipt
+        now = datetime.utcnow()
+
+        rows = []
+        for agent_id, agent_records in by_agent.items():
+            agent = await db.get_agent(agent_id)
+            if not agent:
+                raise HTTPException(
+                    status_code=404, detail=f"Agent not found: {agent_id}"
+                )
+
+            previous_hash = await db.get_last_receipt_hash(agent_id)
+            prepared = []
+            for record in agent_records:
+                timestamp = record.timestamp or now
+                if timestamp.tzinfo is not None:
+                    timestamp = timestamp.astimezone(timezone.utc).replace(tzinfo=None)
+                timestamp = timestamp.replace(
+                    microsecond=timestamp.microsecond // 1000 * 1000
+                )
+                prepared.append((uuid7(), record.action, record.result, timestamp))
+
+            signed = trust_engine.sign_receipt_batch(
+                agent_id,
+                [(rid, action, result, ts.isoformat()) for rid, action, result, ts in prepared],
+                previous_hash,
+            )
+            for (rid, action, result, ts), (signature, receipt_hash) in zip(prepared, signed):
+                rows.append(
+                    {
+                        "id": rid,
+                        "agent_id": agent_id,
+                        "action": action,
+                        "result": result,
+                        "timestamp": ts,
+                        "signature": signature,
+                        "previous_hash": previous_hash,
+                        "receipt_hash": receipt_hash,
+                    }
+                )
+                previous_hash = receipt_hash
+
+            last = agent_records[-1]
+            background.add_task(
+                _recompute_agent_scores,
+                agent_id,
+                last.action,
+                last.result,
+                [r.result for r in agent_records],
+            )
+
+        await db.create_receipts_bulk(rows)
+
+        logger.info("actions_recorded_batch", count=len(rows), agents=len(by_agent))
+        return [ActionReceipt.model_construct(**r) for r in rows]
+
+
 @app.post("/authorize", response_model=AuthorizationResponse)
-async def authorize_action(request: AuthorizationRequest, api_key: str = Depends(verify_api_key)):
+async def authorize_action(request: AuthorizationRequest, api_key: ApiKeyDep):
     """Check if agent is authorized for an action"""
     with tracer.start_as_current_span("authorize_action"):
         agent = await db.get_agent(request.agent_id)
         if not agent:
             raise HTTPException(status_code=404, detail="Agent not found")
 
-        # Map common actions to required tiers
-        action_policies = {
-            "read_config": (0, 0.0),
-            "view_status": (0, 0.0),
-            "send_notification": (1, 0.2),
-            "read_data": (1, 0.2),
-            "write_data": (2, 0.5),
-            "call_api": (2, 0.5),
-            "send_email": (2, 0.5),
-            "delete_data": (3, 0.8),
-            "delete_database": (3, 0.9),
-            "admin_action": (3, 0.85),
-        }
-
-        # Default policy for unknown actions
-        required_tier, required_score = action_policies.get(request.action, (1, 0.3))
+        required_tier, required_score = ACTION_POLICIES.get(request.action, DEFAULT_POLICY)
 
         # Check authorization
         allowed, reason = trust_engine.check_authorization(
@@ -491,7 +784,7 @@ async def authorize_action(request: AuthorizationRequest, api_key: str = Depends
                 )
             )
 
-            await trigger_webhooks(
+            queue_webhooks(
                 WebhookEvent.AUTHORIZATION_DENIED,
                 {"agent_id": request.agent_id, "action": request.action, "reason": reason},
             )
@@ -517,29 +810,97 @@ async def authorize_action(request: AuthorizationRequest, api_key: str = Depends
 
 
 @app.post("/authorize/batch", response_model=BatchAuthorizationResponse)
-async def authorize_batch(request: BatchAuthorizationRequest, api_key: str = Depends(verify_api_key)):
+async def authorize_batch(request: BatchAuthorizationRequest, api_key: ApiKeyDep):
     """Batch authorization check for multiple actions"""
     with tracer.start_as_current_span("authorize_batch"):
-        results = {}
+        # One agent fetch; the per-action decisions are pure CPU
+        agent = await db.get_agent(request.agent_id)
+        if not agent:
+            raise HTTPException(status_code=404, detail="Agent not found")
 
+        tier = agent["tier"]
+        score = agent["composite_score"]
+        results = {}
+        denied = []
         for action in request.actions:
-            auth_request = AuthorizationRequest(agent_id=request.agent_id, action=action)
-            auth_response = await authorize_action(auth_request, api_key)
-            results[action] = auth_response
+            required_tier, required_score = ACTION_POLICIES.get(action, DEFAULT_POLICY)
+            allowed, reason = trust_engine.check_authorization(
+                tier, required_tier, score, required_score
+            )
+            results[action] = AuthorizationResponse(
+                allowed=allowed,
+                agent_id=request.agent_id,
+                action=action,
+                current_tier=tier,
+                required_tier=required_tier,
+                current_score=score,
+                required_score=required_score,
+                reason=reason,
+            )
+            if not allowed:
+                denied.append((action, reason))
+
+        # Fan out denial events once at the end instead of per action
+        if denied:
+            denied_at = datetime.utcnow()
+            await asyncio.gather(
+                *(
+                    broadcast_websocket(
+                        WebSocketMessage(
+                            type="auth_denied",
+                            timestamp=denied_at,
+                            data={
+                                "agent_id": request.agent_id,
+                                "action": action,
+                                "reason": reason,
+                                "tier": tier,
+                                "score": score,
+                            },
+                        )
+                    )
+                    for action, reason in denied
+                ),
+            )
+            for action, reason in denied:
+                queue_webhooks(
+                    WebhookEvent.AUTHORIZATION_DENIED,
+                    {"agent_id": request.agent_id, "action": action, "reason": reason},
+                )
 
+        logger.info(
+            "authorization_batch_check",
+            agent_id=request.agent_id,
+            actions=len(request.actions),
+            denied=len(denied),
+        )
         return BatchAuthorizationResponse(agent_id=request.agent_id, results=results)
 
 
 @app.get("/tiers", response_model=List[TrustTier])
-async def get_tiers(api_key: str = Depends(verify_api_key)):
+async def get_tiers(
+    api_key: ApiKeyDep, if_none_match: Optional[str] = Header(None)
+):
     """List authorization tiers"""
-    tiers = await db.get_tiers()
-    return [TrustTier(**tier) for tier in tiers]
+    global _tiers_response_cache, _tiers_etag
+    if _tiers_response_cache is None:
+        tiers = await db.get_tiers()
+        _tiers_response_cache = orjson.dumps(tiers)
+        _tiers_etag = (
+            f'"{hashlib.blake2b(_tiers_response_cache, digest_size=8).hexdigest()}"'
+        )
+    if if_none_match == _tiers_etag:
+        return Response(status_code=304)
+    return Response(
+        content=_tiers_response_cache,
+        media_type="application/json",
+        headers={"ETag": _tiers_etag},
+    )
 
 
 @app.put("/tiers/{tier_num}", response_model=TrustTier)
-async def update_tier(tier_num: int, tier: TrustTier, api_key: str = Depends(verify_api_key)):
+async def update_tier(tier_num: int, tier: TrustTier, api_key: ApiKeyDep):
     """Configure authorization tier (admin only)"""
+    global _tiers_response_cache
     existing = await db.get_tier(tier_num)
     if not existing:
         raise HTTPException(status_code=404, detail="Tier not found")
@@ -553,32 +914,93 @@ async def update_tier(tier_num: int, tier: TrustTier, api_key: str = Depends(ver
         permissions=tier.permissions,
     )
 
+    trust_engine.set_tiers(await db.get_tiers())
+    # Invalidate after the write: a GET racing the update above would
+    # re-cache the old tier table, pinning stale bytes and a stale ETag
+    _tiers_response_cache = None
     updated = await db.get_tier(tier_num)
     return TrustTier(**updated)
 
 
 @app.get("/receipts/{agent_id}", response_model=List[ActionReceipt])
-async def get_receipts(agent_id: str, api_key: str = Depends(verify_api_key)):
+async def get_receipts(agent_id: str, api_key: ApiKeyDep):
     """Get action receipt chain for an agent"""
     agent = await db.get_agent(agent_id)
     if not agent:
         raise HTTPException(status_code=404, detail="Agent not found")
 
     receipts = await db.get_receipts(agent_id)
-    return [ActionReceipt(**receipt) for receipt in receipts]
+    # Rows are already response-shaped dicts; skip per-field Pydantic
+    # validation on what can be a chain of thousands of receipts.
+    return ORJSONResponse(content=receipts)
+
+
+@app.get("/receipts/{agent_id}/stream")
+async def stream_receipts(agent_id: str, api_key: ApiKeyDep):
+    """Stream an agent's receipt chain as NDJSON
+
+    Long chains are yielded row by row instead of being materialized as
+    one list, so clients can start parsing immediately and server memory
+    stays flat regardless of chain length.
+    """
+    agent = await db.get_agent(agent_id)
+    if not agent:
+        raise HTTPException(status_code=404, detail="Agent not found")
+
+    async def generate():
+        async for receipt in db.iter_receipts(agent_id):
+            yield orjson.dumps(receipt) + b"\n"
+
+    return StreamingResponse(generate(), media_type="application/x-ndjson")
+
+
+@app.get("/receipts/{agent_id}/verify")
+async def verify_receipts(agent_id: str, api_key: ApiKeyDep):
+    """Verify an agent's receipt chain server-side
+
+    Checks every signature, receipt hash, and previous-hash link in one
+    pass so auditing clients do not have to pull the chain and verify it
+    themselves.
+    """
+    agent = await db.get_agent(agent_id)
+    if not agent:
+        raise HTTPException(status_code=404, detail="Agent not found")
+
+    receipts = await db.get_receipts(agent_id)
+    return {
+        "agent_id": agent_id,
+        "receipt_count": len(receipts),
+        "valid": trust_engine.verify_chain(receipts),
+    }
+
+
+# Dashboards poll /stats aggressively; a 2 s cache collapses concurrent
+# polls into one aggregate query, with the lock deduplicating refills
+_stats_cache: Optional[tuple] = None
+_stats_lock = asyncio.Lock()
 
 
 @app.get("/stats", response_model=DashboardStats)
-async def get_stats(api_key: str = Depends(verify_api_key)):
+async def get_stats(api_key: ApiKeyDep):
     """Get dashboard statistics"""
-    stats = await db.get_stats()
+    global _stats_cache
+    cached = _stats_cache
+    if cached is not None and cached[0] > time.monotonic():
+        return DashboardStats(**cached[1])
+
+    async with _stats_lock:
+        cached = _stats_cache
+        if cached is not None and cached[0] > time.monotonic():
+            return DashboardStats(**cached[1])
+        stats = await db.get_stats()
+        _stats_cache = (time.monotonic() + 2.0, stats)
     return DashboardStats(**stats)
 
 
 @app.post("/config/webhooks", response_model=WebhookConfig)
-async def create_webhook(webhook: WebhookConfig, api_key: str = Depends(verify_api_key)):
+async def create_webhook(webhook: WebhookConfig, api_key: ApiKeyDep):
     """Configure webhook for trust events"""
-    webhook_id = str(uuid.uuid4())
+    webhook_id = uuid7()
     
     await db.create_webhook(
         webhook_id=webhook_id,
@@ -602,43 +1024,44 @@ async def create_webhook(webhook: WebhookConfig, api_key: str = Depends(verify_a
 
 
 @app.get("/config/webhooks", response_model=List[WebhookConfig])
-async def list_webhooks(api_key: str = Depends(verify_api_key)):
+async def list_webhooks(api_key: ApiKeyDep):
     """List all webhook configurations"""
     webhooks = await db.get_webhooks()
-    return [WebhookConfig(**w) for w in webhooks]
+    return [WebhookConfig.model_construct(**w) for w in webhooks]
 
 
 @app.websocket("/ws/dashboard")
 async def websocket_dashboard(websocket: WebSocket):
     """WebSocket endpoint for real-time dashboard updates"""
     await websocket.accept()
-    websocket_connections.add(websocket)
+    _ws_register(websocket)
     logger.info("websocket_connected", client=websocket.client)
 
     try:
         # Send initial stats
         stats = await db.get_stats()
-        await websocket.send_json(
-            WebSocketMessage(
-                type="initial_stats",
-                timestamp=datetime.utcnow(),
-                data=stats,
-            ).model_dump(mode="json")
+        await websocket.send_text(
+            orjson.dumps(
+                WebSocketMessage(
+                    type="initial_stats",
+                    timestamp=datetime.utcnow(),
+                    data=stats,
+                ).model_dump(mode="json")
+            ).decode()
         )
 
-        # Keep connection alive
+        # Keep the connection open; liveness is handled by protocol-level
+        # PING/PONG control frames in the server (uvicorn ws-ping-interval),
+        # so idle clients never wake this coroutine
         while True:
-            # Wait for messages (keepalive)
-            data = await websocket.receive_text()
-            if data == "ping":
-                await websocket.send_text("pong")
+            await websocket.receive_text()
 
     except WebSocketDisconnect:
         logger.info("websocket_disconnected", client=websocket.client)
     except Exception as e:
         logger.error("websocket_error", error=str(e))
     finally:
-        websocket_connections.discard(websocket)
+        _ws_unregister(websocket)
 
 
 if __name__ == "__main__":
@@ -1,14 +1,101 @@
 """Trust scoring engine V2 with JWT token issuance"""
+import bisect
 import hmac
 import hashlib
 import math
-from datetime import datetime, timedelta
+import threading
+import time
+from collections import OrderedDict
+from functools import lru_cache
 from typing import Optional, Dict, Tuple, List
-from jose import jwt
+import jwt
 import structlog
 
 logger = structlog.get_logger()
 
+# Per-result contribution to the decay-weighted behavior score
+_RESULT_SCORE = {"success": 1.0, "failure": 0.3, "violation": -1.0}
+
+# Attestation type -> identity-score strength; unknown types are
+# treated as self-declared
+_ATTESTATION_STRENGTH = {"x509": 1.0, "jwt": 0.9, "api_key": 0.6}
+
+# Decoded-JWT cache bound; entries also expire with the token itself
+_JWT_CACHE_MAX = 4096
+
+
+def _receipt_tail(
+    action: str, result: str, timestamp: str, previous_hash: Optional[str]
+) -> bytes:
+    """Variable portion of the receipt signing string, as bytes
+
+    One C-level join instead of an f-string interpolation plus encode;
+    byte-identical to the old f"{action}|{result}|{timestamp}|{prev}".
+    """
+    return b"|".join(
+        (
+            action.encode(),
+            result.encode(),
+            timestamp.encode(),
+            previous_hash.encode() if previous_hash else b"",
+        )
+    )
+
+
+@lru_cache(maxsize=256)
+def _permission_set(permissions: Tuple[str, ...]) -> frozenset:
+    """Compiled permission set for O(1) action membership checks"""
+    return frozenset(permissions)
+
+
+@lru_cache(maxsize=8)
+def _permitted_by_tier(
+    items: Tuple[Tuple[int, Tuple[str, ...]], ...]
+) -> Dict[int, List[str]]:
+    """Per-tier permitted-action lists, resolved once per tier table
+
+    Keyed on the (tier, permissions) contents, so a PUT /tiers change
+    produces a new key rather than needing explicit invalidation.
+    """
+    resolved = {}
+    for tier_num, permissions in items:
+        resolved[tier_num] = ["*"] if "*" in permissions else list(permissions)
+    return resolved
+
+
+@lru_cache(maxsize=8)
+def _tier_thresholds(items: Tuple[Tuple[float, int], ...]) -> Tuple[tuple, tuple]:
+    """Sorted (min_scores, tier_nums) for bisect lookup
+
+    Tiers only change via admin PUT /tiers, so a changed tier table is a
+    new cache key and stale entries age out on their own.
+    """
+    ordered = sorted(items)
+    return tuple(s for s, _ in ordered), tuple(t for _, t in ordered)
+
+
+@lru_cache(maxsize=65536)
+def _check_authorization(
+    agent_tier: int, required_tier: int, agent_score: float, required_score: float
+) -> Tuple[bool, str]:
+    """Memoized authorization decision
+
+    The decision is a pure function of its arguments, so no explicit
+    invalidation is needed: a score or tier change produces a new cache key.
+    """
+    if agent_tier >= required_tier and agent_score >= required_score:
+        return True, "Authorized"
+    elif agent_tier < required_tier:
+        return (
+            False,
+            f"Insufficient trust tier (need tier {required_tier}, have {agent_tier})",
+        )
+    else:
+        return (
+            False,
+            f"Insufficient trust score (need {required_score:.2f}, have {agent_score:.2f})",
+        )
+
 
 class TrustEngine:
     """Core trust scoring and authorization engine"""
@@ -18,10 +105,80 @@ class TrustEngine:
         secret_key: str,
         jwt_secret: Optional[str] = None,
         weights: Optional[Dict[str, float]] = None,
+        mac_algo: str = "hmac-sha256",
     ):
         self.secret_key = secret_key.encode()
         self.jwt_secret = jwt_secret or secret_key
         self.weights = weights or {"identity": 0.3, "config": 0.2, "behavior": 0.5}
+        # MAC midstate cache: one context with the key absorbed, plus
+        # per-agent contexts with the fixed "agent_id|" prefix absorbed,
+        # cloned per receipt so each signature only hashes the variable tail.
+        # Default stays HMAC-SHA256 so existing stored signatures verify;
+        # "blake2b" selects the stdlib's keyed mode, which is faster and
+        # needs no inner/outer hash construction, for fresh deployments.
+        self.mac_algo = mac_algo
+        if mac_algo == "hmac-sha256":
+            self._hmac_template = hmac.new(self.secret_key, digestmod=hashlib.sha256)
+        elif mac_algo == "blake2b":
+            # blake2b keys are capped at 64 bytes; hash longer secrets down
+            key = (
+                self.secret_key
+                if len(self.secret_key) <= 64
+                else hashlib.blake2b(self.secret_key).digest()
+            )
+            self._hmac_template = hashlib.blake2b(key=key, digest_size=32)
+        else:
+            raise ValueError(f"Unsupported mac_algo: {mac_algo}")
+        self._agent_hmacs: Dict[str, "hmac.HMAC"] = {}
+        self._composite = self._compile_composite()
+        # Active tier table, installed via set_tiers() for lookups that
+        # skip passing the table on every call
+        self._tier_min_scores: Optional[Tuple[float, ...]] = None
+        self._tier_ids: Optional[Tuple[int, ...]] = None
+        self._permitted_by_tier: Dict[int, Tuple[str, ...]] = {}
+        self._permitted_set_by_tier: Dict[int, frozenset] = {}
+        # Decoded-token cache: token -> (exp, payload). Middleware tends to
+        # verify the same token many times within its lifetime; a hit is a
+        # dict lookup plus a timestamp compare instead of HMAC + b64 parse.
+        self._jwt_cache: "OrderedDict[str, Tuple[int, Dict]]" = OrderedDict()
+        self._jwt_cache_lock = threading.Lock()
+
+    def set_tiers(self, tiers: List[Dict]):
+        """Install the active tier table
+
+        Sorts once on configuration load so determine_tier can bisect
+        precomputed thresholds without receiving the table per call.
+        Call again whenever the tier config changes.
+        """
+        ordered = sorted(tiers, key=lambda t: t["min_score"])
+        self._tier_min_scores = tuple(t["min_score"] for t in ordered)
+        self._tier_ids = tuple(t["tier"] for t in ordered)
+        # Pre-resolve the wildcard once per tier so hot-path lookups are a
+        # single dict access with no scan over the permission strings
+        self._permitted_by_tier = {
+            t["tier"]: ("*",) if "*" in t["permissions"] else tuple(t["permissions"])
+            for t in tiers
+        }
+        self._permitted_set_by_tier = {
+            tier: frozenset(permissions)
+            for tier, permissions in self._permitted_by_tier.items()
+        }
+
+    def _compile_composite(self):
+        """Compile a composite-score function specialized to the current weights
+
+        Folding the weights in as constants removes the per-call dict lookups
+        on self.weights; call this again if the weights are ever changed.
+        """
+        src = (
+            "def _composite(identity, config, behavior):\n"
+            f"    return {self.weights['identity']!r} * identity"
+            f" + {self.weights['config']!r} * config"
+            f" + {self.weights['behavior']!r} * behavior\n"
+        )
+        namespace: Dict = {}
+        exec(src, namespace)  # noqa: S102 - source is built from our own floats
+        return namespace["_composite"]
 
     def calculate_identity_score(self, agent: Dict) -> Tuple[float, Dict]:
         """
@@ -43,15 +200,9 @@ class TrustEngine:
         # Bonus for SPIFFE identity and attestation
         attestation = agent.get("attestation")
         if attestation:
-            attestation_type = attestation.get("type")
-            if attestation_type == "x509":
-                factors["attestation_strength"] = 1.0  # Strongest
-            elif attestation_type == "jwt":
-                factors["attestation_strength"] = 0.9
-            elif attestation_type == "api_key":
-                factors["attestation_strength"] = 0.6
-            else:
-                factors["attestation_strength"] = 0.3  # Self-declared
+            factors["attestation_strength"] = _ATTESTATION_STRENGTH.get(
+                attestation.get("type"), 0.3  # Unknown types are self-declared
+            )
         else:
             factors["attestation_strength"] = 0.0
 
@@ -69,6 +220,30 @@ class TrustEngine:
         score = min(1.0, base_score)
         return score, factors
 
+    def _identity_score_fast(self, agent: Dict) -> float:
+        """Identity score without materializing the factors dict
+
+        The score-recompute paths discard the factors, so this folds the
+        ternaries straight into the weighted sum. Must stay in lockstep
+        with calculate_identity_score; the breakdown endpoint keeps the
+        full version.
+        """
+        attestation = agent.get("attestation")
+        strength = (
+            _ATTESTATION_STRENGTH.get(attestation.get("type"), 0.3) if attestation else 0.0
+        )
+        capabilities = agent.get("capabilities") or []
+        base_score = (
+            (0.15 if agent.get("name") else 0.0)
+            + (0.15 if agent.get("provider") else 0.0)
+            + (0.15 if agent.get("config_hash") else 0.0)
+            + (0.15 if capabilities else 0.0)
+            + min(len(capabilities) / 10.0, 1.0) * 0.10
+            + (0.15 if agent.get("spiffe_id") else 0.0)
+            + strength * 0.15
+        )
+        return min(1.0, base_score)
+
     def calculate_config_score(self, agent: Dict) -> Tuple[float, Dict]:
         """
         Calculate configuration score based on hash stability
@@ -101,31 +276,34 @@ class TrustEngine:
         if not receipts:
             return 0.0, {"total_actions": 0, "success_rate": 0.0, "recent_weight": 1.0}
 
-        # Count outcomes
-        successes = sum(1 for r in receipts if r["result"] == "success")
-        failures = sum(1 for r in receipts if r["result"] == "failure")
-        violations = sum(1 for r in receipts if r["result"] == "violation")
         total = len(receipts)
 
-        # Base success rate
-        success_rate = successes / total if total > 0 else 0.0
-
-        # Apply exponential decay weighting (recent actions weighted more)
+        # Single pass: count outcomes and accumulate the decay-weighted score
+        # (recent actions weighted more)
+        successes = 0
+        failures = 0
+        violations = 0
         weighted_score = 0.0
-        total_weight = 0.0
         decay_factor = 0.95  # Recent actions get higher weight
 
-        for i, receipt in enumerate(receipts):
-            weight = math.pow(decay_factor, i)  # More recent = higher weight
+        weight = 1.0
+        for receipt in receipts:
+            result = receipt["result"]
+            if result == "success":
+                successes += 1
+            elif result == "failure":
+                failures += 1
+            elif result == "violation":
+                violations += 1
+
+            weighted_score += weight * _RESULT_SCORE.get(result, 0.0)
+            weight *= decay_factor  # More recent = higher weight
 
-            if receipt["result"] == "success":
-                weighted_score += weight * 1.0
-            elif receipt["result"] == "failure":
-                weighted_score += weight * 0.3  # Partial penalty
-            elif receipt["result"] == "violation":
-                weighted_score += weight * -1.0  # Strong penalty
+        # Geometric series in closed form instead of accumulating per row
+        total_weight = (1.0 - decay_factor**total) / (1.0 - decay_factor)
 
-            total_weight += weight
+        # Base success rate
+        success_rate = successes / total if total > 0 else 0.0
 
         # Normalize
         final_score = weighted_score / total_weight if total_weight > 0 else 0.0
@@ -144,25 +322,87 @@ class TrustEngine:
 
         return final_score, factors
 
+    def update_behavior_incrementally(
+        self, agent: Dict, results: List[str]
+    ) -> Tuple[float, Dict]:
+        """
+        Fold newly recorded results into the agent's rolling aggregates
+
+        With receipts weighted newest-first by decay d, appending a new
+        result v gives weighted' = v + d * weighted, so the score can be
+        maintained in O(1) per action from the counters persisted on the
+        agent row instead of rescanning the whole chain.
+        Returns: (behavior_score, new aggregate state)
+        """
+        total = agent.get("action_count") or 0
+        successes = agent.get("success_count") or 0
+        failures = agent.get("failure_count") or 0
+        violations = agent.get("violation_count") or 0
+        weighted = agent.get("behavior_weighted") or 0.0
+        decay_factor = 0.95
+
+        for result in results:  # oldest to newest
+            if result == "success":
+                successes += 1
+            elif result == "failure":
+                failures += 1
+            elif result == "violation":
+                violations += 1
+            total += 1
+            weighted = _RESULT_SCORE.get(result, 0.0) + decay_factor * weighted
+
+        # Closed form of sum(d**i for i in range(total))
+        total_weight = (1.0 - decay_factor**total) / (1.0 - decay_factor)
+        score = weighted / total_weight if total_weight > 0 else 0.0
+        score = max(0.0, min(1.0, score))
+
+        state = {
+            "action_count": total,
+            "success_count": successes,
+            "failure_count": failures,
+            "violation_count": violations,
+            "behavior_weighted": weighted,
+        }
+        return score, state
+
     def calculate_composite_score(
         self, identity: float, config: float, behavior: float
     ) -> float:
         """Calculate weighted composite trust score"""
-        composite = (
-            self.weights["identity"] * identity
-            + self.weights["config"] * config
-            + self.weights["behavior"] * behavior
-        )
-
         # Clamp to [0, 1]
-        return max(0.0, min(1.0, composite))
+        return max(0.0, min(1.0, self._composite(identity, config, behavior)))
+
+    def recompute_scores(
+        self, agent: Dict, receipts: list
+    ) -> Tuple[float, float, float, float]:
+        """
+        Recompute all scores for an agent in one call
+        Returns: (identity, config, behavior, composite)
+        """
+        identity = self._identity_score_fast(agent)
+        config, _ = self.calculate_config_score(agent)
+        behavior, _ = self.calculate_behavior_score(receipts)
+        composite = self.calculate_composite_score(identity, config, behavior)
+        return identity, config, behavior, composite
 
-    def determine_tier(self, score: float, tiers: list) -> int:
-        """Determine trust tier based on score"""
-        for tier_data in sorted(tiers, key=lambda t: t["tier"], reverse=True):
-            if score >= tier_data["min_score"]:
-                return tier_data["tier"]
-        return 0  # Default to lowest tier
+    def determine_tier(self, score: float, tiers: Optional[list] = None) -> int:
+        """Determine trust tier based on score
+
+        With no explicit table, uses the thresholds installed by
+        set_tiers() — the fast path for service call sites.
+        """
+        if tiers is None:
+            min_scores, tier_nums = self._tier_min_scores, self._tier_ids
+            if min_scores is None:
+                return 0  # No tier table installed yet
+        else:
+            min_scores, tier_nums = _tier_thresholds(
+                tuple((t["min_score"], t["tier"]) for t in tiers)
+            )
+        idx = bisect.bisect_right(min_scores, score) - 1
+        if idx < 0:
+            return 0  # Default to lowest tier
+        return tier_nums[idx]
 
     def sign_receipt(
         self,
@@ -172,10 +412,34 @@ class TrustEngine:
         timestamp: str,
         previous_hash: Optional[str] = None,
     ) -> str:
-        """Generate HMAC-SHA256 signature for action receipt"""
-        message = f"{agent_id}|{action}|{result}|{timestamp}|{previous_hash or ''}"
-        signature = hmac.new(self.secret_key, message.encode(), hashlib.sha256).hexdigest()
-        return signature
+        """Generate signature for action receipt using the configured MAC"""
+        return self._sign_receipt_raw(
+            agent_id, action, result, timestamp, previous_hash
+        ).hex()
+
+    def _sign_receipt_raw(
+        self,
+        agent_id: str,
+        action: str,
+        result: str,
+        timestamp: str,
+        previous_hash: Optional[str] = None,
+    ) -> bytes:
+        """Raw 32-byte signature; verification compares this directly"""
+        h = self._agent_prefix_hmac(agent_id).copy()
+        h.update(_receipt_tail(action, result, timestamp, previous_hash))
+        return h.digest()
+
+    def _agent_prefix_hmac(self, agent_id: str) -> "hmac.HMAC":
+        """Get the cached HMAC context pre-absorbed with 'agent_id|'"""
+        h = self._agent_hmacs.get(agent_id)
+        if h is None:
+            if len(self._agent_hmacs) >= 4096:
+                self._agent_hmacs.clear()
+            h = self._hmac_template.copy()
+            h.update(f"{agent_id}|".encode())
+            self._agent_hmacs[agent_id] = h
+        return h
 
     def verify_receipt(
         self,
@@ -187,12 +451,138 @@ class TrustEngine:
         previous_hash: Optional[str] = None,
     ) -> bool:
         """Verify receipt signature"""
-        expected = self.sign_receipt(agent_id, action, result, timestamp, previous_hash)
-        return hmac.compare_digest(signature, expected)
+        try:
+            provided = bytes.fromhex(signature)
+        except ValueError:
+            return False
+        expected = self._sign_receipt_raw(agent_id, action, result, timestamp, previous_hash)
+        return hmac.compare_digest(provided, expected)
 
     def hash_receipt(self, receipt_id: str, signature: str) -> str:
-        """Generate hash for receipt chaining"""
-        return hashlib.sha256(f"{receipt_id}|{signature}".encode()).hexdigest()
+        """Generate hash for receipt chaining
+
+        blake2b is the fastest keyless primitive in the stdlib for short
+        inputs; the 32-byte digest keeps the stored 64-hex format.
+        """
+        return hashlib.blake2b(
+            f"{receipt_id}|{signature}".encode(), digest_size=32
+        ).hexdigest()
+
+    def _receipt_hash_matches(self, receipt_id: str, signature: str, stored_hash: str) -> bool:
+        """Check a stored receipt hash against the current and legacy formats
+
+        Chains written before the blake2b switch stored SHA-256 hashes in
+        the same 64-hex shape; accept those so verification doesn't flag
+        pre-upgrade chains as tampered.
+        """
+        if stored_hash == self.hash_receipt(receipt_id, signature):
+            return True
+        return (
+            stored_hash
+            == hashlib.sha256(f"{receipt_id}|{signature}".encode()).hexdigest()
+        )
+
+    def sign_receipt_batch(
+        self,
+        agent_id: str,
+        records: List[Tuple[str, str, str, str]],
+        previous_hash: Optional[str] = None,
+    ) -> List[Tuple[str, str]]:
+        """
+        Sign a batch of receipts for one agent, chaining hashes in-memory
+
+        Args:
+            agent_id: Agent ID
+            records: List of (receipt_id, action, result, timestamp) tuples
+            previous_hash: Hash of the current chain tail, if any
+
+        Returns:
+            List of (signature, receipt_hash) tuples, in input order
+        """
+        signed = []
+        prefix_hmac = self._agent_prefix_hmac(agent_id)
+        for receipt_id, action, result, timestamp in records:
+            h = prefix_hmac.copy()
+            h.update(_receipt_tail(action, result, timestamp, previous_hash))
+            signature = h.hexdigest()
+            receipt_hash = self.hash_receipt(receipt_id, signature)
+            signed.append((signature, receipt_hash))
+            previous_hash = receipt_hash
+
+        return signed
+
+    def verify_chain(self, receipts: List[Dict]) -> bool:
+        """
+        Verify an agent's full receipt chain in one pass
+
+        Accepts receipts as returned by Database.get_receipts (newest first)
+        and checks, oldest to newest, that each signature matches, that each
+        receipt_hash is the hash of (id, signature), and that previous_hash
+        links to the prior receipt's hash.
+        """
+        previous_hash = None
+        for receipt in reversed(receipts):
+            if receipt["previous_hash"] != previous_hash:
+                return False
+
+            timestamp = receipt["timestamp"]
+            if not isinstance(timestamp, str):
+                timestamp = timestamp.isoformat()
+
+            if not self.verify_receipt(
+                receipt["agent_id"],
+                receipt["action"],
+                receipt["result"],
+                timestamp,
+                receipt["signature"],
+                previous_hash,
+            ):
+                return False
+
+            if not self._receipt_hash_matches(
+                receipt["id"], receipt["signature"], receipt["receipt_hash"]
+            ):
+                return False
+
+            previous_hash = receipt["receipt_hash"]
+
+        return True
+
+    def verify_chain_details(self, receipts: List[Dict]) -> List[bool]:
+        """
+        Verify a receipt chain, reporting validity per receipt
+
+        Same checks as verify_chain but without the short-circuit, so a
+        tampered chain can be narrowed to the receipts that fail. Results
+        are in input order (newest first). A broken link invalidates the
+        receipt whose previous_hash no longer matches; later receipts are
+        still checked against the hashes they actually recorded.
+        """
+        results = [True] * len(receipts)
+        previous_hash = None
+        for index in range(len(receipts) - 1, -1, -1):
+            receipt = receipts[index]
+            timestamp = receipt["timestamp"]
+            if not isinstance(timestamp, str):
+                timestamp = timestamp.isoformat()
+
+            results[index] = (
+                receipt["previous_hash"] == previous_hash
+                and self.verify_receipt(
+                    receipt["agent_id"],
+                    receipt["action"],
+                    receipt["result"],
+                    timestamp,
+                    receipt["signature"],
+                    receipt["previous_hash"],
+                )
+                and self._receipt_hash_matches(
+                    receipt["id"], receipt["signature"], receipt["receipt_hash"]
+                )
+            )
+            previous_hash = receipt["receipt_hash"]
+
+        return results
 
     def check_authorization(
         self,
@@ -202,18 +592,7 @@ class TrustEngine:
         required_score: float,
     ) -> Tuple[bool, str]:
         """Check if agent is authorized for action"""
-        if agent_tier >= required_tier and agent_score >= required_score:
-            return True, "Authorized"
-        elif agent_tier < required_tier:
-            return (
-                False,
-                f"Insufficient trust tier (need tier {required_tier}, have {agent_tier})",
-            )
-        else:
-            return (
-                False,
-                f"Insufficient trust score (need {required_score:.2f}, have {agent_score:.2f})",
-            )
+        return _check_authorization(agent_tier, required_tier, agent_score, required_score)
 
     def issue_jwt_token(
         self,
@@ -238,15 +617,17 @@ class TrustEngine:
         Returns:
             JWT token string
         """
-        now = datetime.utcnow()
+        # PyJWT accepts integer epoch seconds for iat/exp directly, which
+        # skips two datetime allocations per token
+        now_ts = int(time.time())
         payload = {
             "sub": agent_id,
             "name": agent_name,
             "tier": tier,
             "trust_score": round(composite_score, 3),
             "permitted_actions": permitted_actions,
-            "iat": now,
-            "exp": now + timedelta(seconds=expires_in),
+            "iat": now_ts,
+            "exp": now_ts + expires_in,
             "iss": "trust-gateway",
         }
 
@@ -272,27 +653,63 @@ class TrustEngine:
             Decoded token payload
             
         Raises:
-            jose.JWTError: If token is invalid or expired
+            jwt.InvalidTokenError: If token is invalid or expired
         """
-        payload = jwt.decode(token, self.jwt_secret, algorithms=["HS256"])
+        entry = self._jwt_cache.get(token)
+        if entry is not None:
+            exp, payload = entry
+            if exp > time.time():
+                return payload
+            with self._jwt_cache_lock:
+                self._jwt_cache.pop(token, None)
+
+        payload = jwt.decode(
+            token,
+            self.jwt_secret,
+            algorithms=["HS256"],
+            options={"require": ["exp", "iat", "iss"]},
+        )
+        with self._jwt_cache_lock:
+            self._jwt_cache[token] = (payload["exp"], payload)
+            while len(self._jwt_cache) > _JWT_CACHE_MAX:
+                self._jwt_cache.popitem(last=False)
         return payload
 
-    def get_permitted_actions_for_tier(self, tier: int, tiers_config: List[Dict]) -> List[str]:
+    def get_permitted_actions_for_tier(
+        self, tier: int, tiers_config: Optional[List[Dict]] = None
+    ) -> List[str]:
         """
         Get permitted actions for a given tier
-        
+
         Args:
             tier: Trust tier number
-            tiers_config: List of tier configurations
-            
+            tiers_config: List of tier configurations; omit to use the
+                table installed via set_tiers()
+
         Returns:
             List of permitted actions
         """
-        for tier_data in tiers_config:
-            if tier_data["tier"] == tier:
-                permissions = tier_data["permissions"]
-                if "*" in permissions:
-                    return ["*"]  # Full access
-                return permissions
-
-        return []  # No permissions
+        if tiers_config is None:
+            return list(self._permitted_by_tier.get(tier, ()))
+        resolved = _permitted_by_tier(
+            tuple((t["tier"], tuple(t["permissions"])) for t in tiers_config)
+        )
+        return resolved.get(tier, [])  # No permissions for unknown tiers
+
+    def is_action_permitted(
+        self, tier: int, action: str, tiers_config: Optional[List[Dict]] = None
+    ) -> bool:
+        """
+        Check whether a tier's permissions include an action
+
+        Uses a cached frozenset per permission list so the membership test
+        is O(1) instead of a linear scan over the permission strings. With
+        no explicit table, checks against the sets built by set_tiers().
+        """
+        if tiers_config is None:
+            permissions = self._permitted_set_by_tier.get(tier, frozenset())
+        else:
+            permissions = _permission_set(
+                tuple(self.get_permitted_actions_for_tier(tier, tiers_config))
+            )
+        return "*" in permissions or action in permissions
@@ -1,5 +1,17 @@
 """Trust Gateway Python SDK V2"""
-from .client import TrustClient, TrustClientAsync, WebSocketDashboard
+from .client import (
+    TrustClient,
+    TrustClientAsync,
+    WebSocketDashboard,
+    get_async_client,
+    hash_config,
+)
 
 __version__ = "2.0.0"
-__all__ = ["TrustClient", "TrustClientAsync", "WebSocketDashboard"]
+__all__ = [
+    "TrustClient",
+    "TrustClientAsync",
+    "WebSocketDashboard",
+    "get_async_client",
+    "hash_config",
+]
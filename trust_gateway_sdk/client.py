@@ -1,30 +1,214 @@
 """Trust Gateway SDK V2 - Async + Sync + WebSocket + JWT"""
 import asyncio
-import json
-from typing import List, Optional, Dict, Any, Callable
+import hashlib
+import os
+import time
+from functools import lru_cache
+from typing import List, Optional, Dict, Any, Callable, Tuple
 from datetime import datetime
 
 import httpx
+import orjson
 import websockets
 
+try:
+    import msgpack
+except ImportError:  # Optional: smaller, faster dashboard frames
+    msgpack = None
+
+
+# Shared per-request header dict; orjson bodies must label themselves
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
+# Issued tokens are served from cache until this close to their expiry
+_TOKEN_TTL_SKEW = 60.0
+
+
+def _install_url_templates(client) -> None:
+    """Precompute endpoint URLs on a client instance
+
+    Static endpoints become plain strings and per-agent ones become
+    %s templates, so call sites do one C-level substitution instead of
+    re-running f-string formatting on every request.
+    """
+    base = client.base_url
+    client._url_register = base + "/agents/register"
+    client._url_agent = base + "/agents/%s"
+    client._url_trust = client._url_agent + "/trust"
+    client._url_history = client._url_agent + "/history"
+    client._url_card = client._url_agent + "/card"
+    client._url_token = client._url_agent + "/token"
+    client._url_record = base + "/actions/record"
+    client._url_record_batch = client._url_record + "/batch"
+    client._url_authorize = base + "/authorize"
+    client._url_authorize_batch = client._url_authorize + "/batch"
+    client._url_tiers = base + "/tiers"
+    client._url_tier = client._url_tiers + "/%s"
+    client._url_receipts = base + "/receipts/%s"
+    client._url_receipts_stream = client._url_receipts + "/stream"
+    client._url_stats = base + "/stats"
+    client._url_webhooks = base + "/config/webhooks"
+    client._url_health = base + "/health"
+
+
+def _uds_path(base_url: str) -> Optional[str]:
+    """Unix socket path for same-host deployments, if configured
+
+    When the base URL targets the local host and TRUST_GATEWAY_UDS names
+    an existing socket, requests bypass the TCP loopback stack entirely —
+    fewer syscalls per small request with no caller-visible change. The
+    HTTP host header still comes from base_url.
+    """
+    if not base_url.startswith(("http://localhost", "http://127.0.0.1")):
+        return None
+    path = os.environ.get("TRUST_GATEWAY_UDS")
+    if path and os.path.exists(path):
+        return path
+    return None
+
+
+def hash_config(config: str) -> str:
+    """
+    Hash an agent configuration for registration
+
+    Uses BLAKE2b, which is considerably faster than SHA-256 in pure software.
+    The gateway treats config_hash as an opaque stability token, so the
+    algorithm only needs to be consistent on the client side.
+    """
+    return hashlib.blake2b(config.encode(), digest_size=32).hexdigest()
+
+
+class _AuthorizeBatcher:
+    """Coalesces concurrent authorize() calls into authorize_batch requests
+
+    Submissions queue as (agent_id, action, future) tuples. A lazily
+    started task drains the queue after a short debounce window, groups
+    by agent, issues one POST /authorize/batch per agent, and resolves
+    each caller's future with its per-action decision — turning N round
+    trips into one per agent. The task exits when the queue stays idle
+    and restarts on the next submit.
+    """
+
+    def __init__(
+        self,
+        client: "TrustClientAsync",
+        batch_window_ms: float = 3.0,
+        max_batch_size: int = 64,
+    ):
+        self._client = client
+        self._window = batch_window_ms / 1000.0
+        self._max_batch = max_batch_size
+        self._queue: asyncio.Queue = asyncio.Queue()
+        self._task: Optional[asyncio.Task] = None
+
+    async def submit(self, agent_id: str, action: str) -> Dict:
+        """Queue one authorization check and await its decision"""
+        future = asyncio.get_running_loop().create_future()
+        self._queue.put_nowait((agent_id, action, future))
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+        return await future
+
+    async def _run(self):
+        while True:
+            try:
+                batch = [await asyncio.wait_for(self._queue.get(), timeout=1.0)]
+            except asyncio.TimeoutError:
+                # A submit can land between the timeout cancelling the get
+                # and this task finishing; it sees a not-yet-done task and
+                # skips the restart, so only exit when nothing is queued
+                if self._queue.empty():
+                    return  # Idle; the next submit restarts the task
+                continue
+            await asyncio.sleep(self._window)
+            while len(batch) < self._max_batch and not self._queue.empty():
+                batch.append(self._queue.get_nowait())
+
+            grouped: Dict[str, List] = {}
+            for agent_id, action, future in batch:
+                grouped.setdefault(agent_id, []).append((action, future))
+
+            for agent_id, items in grouped.items():
+                try:
+                    response = await self._client.authorize_batch(
+                        agent_id, [action for action, _ in items]
+                    )
+                except Exception as exc:
+                    for _, future in items:
+                        if not future.done():
+                            future.set_exception(exc)
+                    continue
+                results = response["results"]
+                for action, future in items:
+                    if not future.done():
+                        future.set_result(results[action])
+
 
 class TrustClientAsync:
     """Async client SDK for Trust Gateway V2 API"""
 
-    def __init__(self, base_url: str, api_key: str):
+    def __init__(
+        self,
+        base_url: str,
+        api_key: str,
+        client: Optional[httpx.AsyncClient] = None,
+        http2: bool = False,
+        coalesce_authorize: bool = False,
+        batch_window_ms: float = 3.0,
+        max_batch_size: int = 64,
+        health_ttl: float = 1.0,
+    ):
         """
         Initialize async Trust Gateway client
 
         Args:
             base_url: Base URL of Trust Gateway API (e.g., http://localhost:8002)
             api_key: API key for authentication
+            client: Optional pre-built httpx.AsyncClient shared across clients
+            http2: Multiplex calls over one HTTP/2 connection with HPACK
+                header compression; requires the httpx[http2] extra and an
+                HTTP/2-capable gateway frontend
+            coalesce_authorize: Merge concurrent authorize() calls into
+                authorize_batch requests behind a short debounce window
+            batch_window_ms: Debounce window for coalesced authorization
+            max_batch_size: Largest coalesced authorization batch
+            health_ttl: Seconds to serve health_check() from cache
         """
         self.base_url = base_url.rstrip("/")
         self.api_key = api_key
-        self.client = httpx.AsyncClient(headers={"X-API-Key": api_key}, timeout=30.0)
+        _install_url_templates(self)
+        self.client = client or httpx.AsyncClient(
+            headers={"X-API-Key": api_key},
+            timeout=30.0,
+            http2=http2,
+            limits=httpx.Limits(
+                max_keepalive_connections=32, max_connections=64, keepalive_expiry=90.0
+            ),
+            transport=httpx.AsyncHTTPTransport(
+                retries=3, http2=http2, uds=_uds_path(self.base_url)
+            ),
+        )
+        self._batcher = (
+            _AuthorizeBatcher(self, batch_window_ms, max_batch_size)
+            if coalesce_authorize
+            else None
+        )
+        # Issued tokens stay valid for expires_in seconds; re-serve them
+        # until close to expiry instead of re-POSTing per call
+        self._token_cache: Dict[Tuple[str, int], Tuple[float, Dict]] = {}
+        self._token_locks: Dict[Tuple[str, int], asyncio.Lock] = {}
+        # Health polls (liveness probes, UI refresh) share one result per
+        # TTL window, and concurrent callers share one in-flight request
+        self._health_ttl = health_ttl
+        self._health_cache: Optional[Tuple[float, Dict]] = None
+        self._health_inflight: Optional[asyncio.Future] = None
+        # Write-behind receipt recording (record_action_async)
+        self._pending_records: asyncio.Queue = asyncio.Queue()
+        self._record_task: Optional[asyncio.Task] = None
 
     async def close(self):
-        """Close the HTTP client"""
+        """Close the HTTP client, flushing any queued receipts first"""
+        await self.flush_records()
         await self.client.aclose()
 
     async def __aenter__(self):
@@ -44,88 +228,261 @@ class TrustClientAsync:
     ) -> Dict:
         """Register a new agent with SPIFFE-compatible identity"""
         response = await self.client.post(
-            f"{self.base_url}/agents/register",
-            json={
+            self._url_register,
+            content=orjson.dumps({
                 "name": name,
                 "provider": provider,
                 "spiffe_id": spiffe_id,
                 "config_hash": config_hash,
                 "capabilities": capabilities,
                 "attestation": attestation,
-            },
+            }),
+            headers=_JSON_HEADERS,
         )
         response.raise_for_status()
-        return response.json()
+        return orjson.loads(response.content)
 
     async def get_agent(self, agent_id: str) -> Dict:
         """Get agent profile and current trust score"""
-        response = await self.client.get(f"{self.base_url}/agents/{agent_id}")
+        response = await self.client.get(self._url_agent % agent_id)
         response.raise_for_status()
-        return response.json()
+        return orjson.loads(response.content)
 
     async def get_trust_breakdown(self, agent_id: str) -> Dict:
         """Get detailed trust score breakdown"""
-        response = await self.client.get(f"{self.base_url}/agents/{agent_id}/trust")
+        response = await self.client.get(self._url_trust % agent_id)
         response.raise_for_status()
-        return response.json()
+        return orjson.loads(response.content)
 
     async def get_trust_history(self, agent_id: str, limit: int = 100) -> Dict:
         """Get trust score history"""
         response = await self.client.get(
-            f"{self.base_url}/agents/{agent_id}/history", params={"limit": limit}
+            self._url_history % agent_id, params={"limit": limit}
         )
         response.raise_for_status()
-        return response.json()
+        return orjson.loads(response.content)
 
     async def get_agent_card(self, agent_id: str) -> Dict:
         """Get A2A-compatible agent capability card"""
-        response = await self.client.get(f"{self.base_url}/agents/{agent_id}/card")
+        response = await self.client.get(self._url_card % agent_id)
         response.raise_for_status()
-        return response.json()
+        return orjson.loads(response.content)
 
-    async def issue_token(self, agent_id: str, expires_in: int = 3600) -> Dict:
-        """Issue JWT token for agent"""
-        response = await self.client.post(
-            f"{self.base_url}/agents/{agent_id}/token", params={"expires_in": expires_in}
+    async def get_agent_full(self, agent_id: str) -> Dict:
+        """Fetch the agent profile, trust breakdown, and capability card at once
+
+        The three GETs run concurrently over the pooled connections, so a
+        UI render pays roughly one round trip instead of three. Returns
+        {"agent": ..., "trust": ..., "card": ...}.
+        """
+        agent, trust, card = await asyncio.gather(
+            self.get_agent(agent_id),
+            self.get_trust_breakdown(agent_id),
+            self.get_agent_card(agent_id),
         )
-        response.raise_for_status()
-        return response.json()
+        return {"agent": agent, "trust": trust, "card": card}
+
+    async def get_dashboard_bundle(self) -> Dict:
+        """Fetch everything a dashboard needs in one concurrent sweep
+
+        Gathers stats, tiers, webhooks, and health concurrently. Returns
+        {"stats": ..., "tiers": ..., "webhooks": ..., "health": ...}.
+        """
+        stats, tiers, webhooks, health = await asyncio.gather(
+            self.get_stats(),
+            self.get_tiers(),
+            self.list_webhooks(),
+            self.health_check(),
+        )
+        return {"stats": stats, "tiers": tiers, "webhooks": webhooks, "health": health}
+
+    async def issue_token(self, agent_id: str, expires_in: int = 3600) -> Dict:
+        """Issue JWT token for agent
+
+        Tokens are cached per (agent_id, expires_in) and re-served until
+        60 seconds before expiry, so hot callers pay a dict lookup rather
+        than a round trip. A per-key lock prevents concurrent callers
+        from stampeding the gateway on refresh.
+        """
+        key = (agent_id, expires_in)
+        entry = self._token_cache.get(key)
+        if entry is not None and time.monotonic() < entry[0]:
+            return entry[1]
+
+        lock = self._token_locks.setdefault(key, asyncio.Lock())
+        async with lock:
+            entry = self._token_cache.get(key)
+            now = time.monotonic()
+            if entry is not None and now < entry[0]:
+                return entry[1]
+
+            response = await self.client.post(
+                self._url_token % agent_id, params={"expires_in": expires_in}
+            )
+            response.raise_for_status()
+            token = orjson.loads(response.content)
+            ttl = expires_in - _TOKEN_TTL_SKEW
+            if ttl > 0:
+                self._token_cache[key] = (now + ttl, token)
+            return token
 
     async def record_action(
         self, agent_id: str, action: str, result: str, timestamp: Optional[datetime] = None
     ) -> Dict:
         """Record an action receipt"""
-        data = {"agent_id": agent_id, "action": action, "result": result}
-        if timestamp:
-            data["timestamp"] = timestamp.isoformat()
+        data = (
+            {"agent_id": agent_id, "action": action, "result": result}
+            if timestamp is None
+            else {
+                "agent_id": agent_id,
+                "action": action,
+                "result": result,
+                "timestamp": timestamp.isoformat(),
+            }
+        )
 
-        response = await self.client.post(f"{self.base_url}/actions/record", json=data)
+        response = await self.client.post(
+            self._url_record, content=orjson.dumps(data), headers=_JSON_HEADERS
+        )
+        response.raise_for_status()
+        return orjson.loads(response.content)
+
+    async def record_actions_batch(self, records: List[Dict[str, Any]]) -> List[Dict]:
+        """Record many action receipts in one request
+
+        Each record is a dict with agent_id, action, result and an optional
+        ISO-format timestamp. The gateway signs the whole batch with one
+        amortized pass over the receipt chain.
+        """
+        response = await self.client.post(
+            self._url_record_batch,
+            content=orjson.dumps(records),
+            headers=_JSON_HEADERS,
+        )
         response.raise_for_status()
-        return response.json()
+        return orjson.loads(response.content)
+
+    async def record_action_async(
+        self, agent_id: str, action: str, result: str, timestamp: Optional[datetime] = None
+    ) -> None:
+        """Queue an action receipt for write-behind recording
+
+        Returns immediately; a background task coalesces receipts queued
+        within a 50 ms window and posts them via the batch endpoint, so
+        the caller's latency drops to a queue append. close() (or
+        flush_records()) drains the queue, and recording errors surface
+        there rather than at the call site. Use record_action when the
+        signed receipt is needed synchronously.
+        """
+        record = (
+            {"agent_id": agent_id, "action": action, "result": result}
+            if timestamp is None
+            else {
+                "agent_id": agent_id,
+                "action": action,
+                "result": result,
+                "timestamp": timestamp.isoformat(),
+            }
+        )
+        self._pending_records.put_nowait(record)
+        task = self._record_task
+        if task is None or task.done():
+            if task is not None and not task.cancelled():
+                # A previous drain died on a failed post after requeueing
+                # its batch; the new task retries it, so the error is
+                # consumed here rather than logged as never retrieved
+                task.exception()
+            self._record_task = asyncio.create_task(self._drain_records())
+
+    async def _drain_records(self):
+        queue = self._pending_records
+        while True:
+            try:
+                batch = [await asyncio.wait_for(queue.get(), timeout=1.0)]
+            except asyncio.TimeoutError:
+                # Same race as the authorize batcher: a record queued while
+                # this task is winding down would otherwise sit until the
+                # next flush
+                if queue.empty():
+                    return  # Idle; the next record_action_async restarts the task
+                continue
+            # Everything from here on holds popped records, so the
+            # requeue handler must cover the debounce sleep too —
+            # flush_records may cancel at any await point, and a failed
+            # post must not drop the batch either. The exception ends the
+            # task; flush_records re-raises it when it awaits the task,
+            # and a restart via record_action_async retries the batch
+            try:
+                await asyncio.sleep(0.05)
+                while len(batch) < 256 and not queue.empty():
+                    batch.append(queue.get_nowait())
+                await self.record_actions_batch(batch)
+            except BaseException:
+                for record in batch:
+                    queue.put_nowait(record)
+                raise
+
+    async def flush_records(self) -> None:
+        """Flush queued receipts now, surfacing any recording error"""
+        task, self._record_task = self._record_task, None
+        if task is not None:
+            if not task.done():
+                task.cancel()
+            try:
+                # Awaiting a finished task re-raises a failed post's
+                # exception; the batch was requeued, so a retry can flush
+                await task
+            except asyncio.CancelledError:
+                pass
+        batch = []
+        while not self._pending_records.empty():
+            batch.append(self._pending_records.get_nowait())
+        if batch:
+            await self.record_actions_batch(batch)
 
     async def authorize(self, agent_id: str, action: str, context: Optional[Dict] = None) -> Dict:
         """Check if agent is authorized for an action"""
-        data = {"agent_id": agent_id, "action": action}
-        if context:
-            data["context"] = context
+        # The batch endpoint has no per-item context, so contextful
+        # checks always take the direct path
+        if self._batcher is not None and context is None:
+            return await self._batcher.submit(agent_id, action)
+
+        data = (
+            {"agent_id": agent_id, "action": action}
+            if context is None
+            else {"agent_id": agent_id, "action": action, "context": context}
+        )
 
-        response = await self.client.post(f"{self.base_url}/authorize", json=data)
+        response = await self.client.post(
+            self._url_authorize, content=orjson.dumps(data), headers=_JSON_HEADERS
+        )
         response.raise_for_status()
-        return response.json()
+        return orjson.loads(response.content)
+
+    async def authorize_many(self, requests: List[Dict[str, Any]]) -> List[Dict]:
+        """Run many authorization checks concurrently
+
+        Each request is a dict of authorize() keyword arguments. The calls
+        share the pooled connections, so N checks cost roughly one RTT of
+        wall time instead of N.
+        """
+        return list(await asyncio.gather(*(self.authorize(**r) for r in requests)))
 
     async def authorize_batch(self, agent_id: str, actions: List[str]) -> Dict:
         """Batch authorization check"""
         response = await self.client.post(
-            f"{self.base_url}/authorize/batch", json={"agent_id": agent_id, "actions": actions}
+            self._url_authorize_batch,
+            content=orjson.dumps({"agent_id": agent_id, "actions": actions}),
+            headers=_JSON_HEADERS,
         )
         response.raise_for_status()
-        return response.json()
+        return orjson.loads(response.content)
 
     async def get_tiers(self) -> List[Dict]:
         """Get all trust tiers"""
-        response = await self.client.get(f"{self.base_url}/tiers")
+        response = await self.client.get(self._url_tiers)
         response.raise_for_status()
-        return response.json()
+        return orjson.loads(response.content)
 
     async def update_tier(
         self,
@@ -138,69 +495,150 @@ class TrustClientAsync:
     ) -> Dict:
         """Update tier configuration (admin only)"""
         response = await self.client.put(
-            f"{self.base_url}/tiers/{tier}",
-            json={
+            self._url_tier % tier,
+            content=orjson.dumps({
                 "tier": tier,
                 "name": name,
                 "min_score": min_score,
                 "max_score": max_score,
                 "description": description,
                 "permissions": permissions,
-            },
+            }),
+            headers=_JSON_HEADERS,
         )
         response.raise_for_status()
-        return response.json()
+        return orjson.loads(response.content)
 
     async def get_receipts(self, agent_id: str) -> List[Dict]:
         """Get action receipt chain"""
-        response = await self.client.get(f"{self.base_url}/receipts/{agent_id}")
+        response = await self.client.get(self._url_receipts % agent_id)
         response.raise_for_status()
-        return response.json()
+        return orjson.loads(response.content)
+
+    async def iter_receipts(self, agent_id: str):
+        """Stream an agent's receipt chain, yielding receipts as they arrive
+
+        Consumes the NDJSON /receipts/{agent_id}/stream endpoint and
+        parses each line from raw bytes, so memory stays bounded by one
+        receipt rather than the whole chain.
+        """
+        async with self.client.stream("GET", self._url_receipts_stream % agent_id) as response:
+            response.raise_for_status()
+            buffer = bytearray()
+            async for chunk in response.aiter_bytes():
+                buffer += chunk
+                while (newline := buffer.find(b"\n")) >= 0:
+                    line = bytes(buffer[:newline])
+                    del buffer[: newline + 1]
+                    if line:
+                        yield orjson.loads(line)
+            if buffer:
+                yield orjson.loads(bytes(buffer))
 
     async def get_stats(self) -> Dict:
         """Get dashboard statistics"""
-        response = await self.client.get(f"{self.base_url}/stats")
+        response = await self.client.get(self._url_stats)
         response.raise_for_status()
-        return response.json()
+        return orjson.loads(response.content)
 
     async def create_webhook(
         self, url: str, events: List[str], secret: Optional[str] = None
     ) -> Dict:
         """Create webhook configuration"""
         response = await self.client.post(
-            f"{self.base_url}/config/webhooks",
-            json={"url": url, "events": events, "secret": secret},
+            self._url_webhooks,
+            content=orjson.dumps({"url": url, "events": events, "secret": secret}),
+            headers=_JSON_HEADERS,
         )
         response.raise_for_status()
-        return response.json()
+        return orjson.loads(response.content)
 
     async def list_webhooks(self) -> List[Dict]:
         """List all webhooks"""
-        response = await self.client.get(f"{self.base_url}/config/webhooks")
+        response = await self.client.get(self._url_webhooks)
         response.raise_for_status()
-        return response.json()
+        return orjson.loads(response.content)
 
     async def health_check(self) -> Dict:
-        """Check API health"""
-        response = await self.client.get(f"{self.base_url}/health")
-        response.raise_for_status()
-        return response.json()
+        """Check API health
+
+        Served from a short TTL cache (default 1 s); concurrent callers
+        during a miss await a single in-flight request instead of each
+        issuing their own.
+        """
+        entry = self._health_cache
+        if entry is not None and time.monotonic() < entry[0]:
+            return entry[1]
+
+        if self._health_inflight is not None:
+            return await asyncio.shield(self._health_inflight)
+
+        future = asyncio.get_running_loop().create_future()
+        self._health_inflight = future
+        try:
+            response = await self.client.get(self._url_health)
+            response.raise_for_status()
+            health = orjson.loads(response.content)
+        except Exception as exc:
+            future.set_exception(exc)
+            # Awaiting callers consume it via shield; mute the "exception
+            # never retrieved" warning when there are none
+            future.exception()
+            raise
+        else:
+            self._health_cache = (time.monotonic() + self._health_ttl, health)
+            future.set_result(health)
+            return health
+        finally:
+            self._health_inflight = None
+            if not future.done():
+                # CancelledError (or any BaseException) skips the handler
+                # above; cancel the future so shielded waiters don't hang
+                future.cancel()
 
 
 class TrustClient:
     """Synchronous client SDK for Trust Gateway V2 API"""
 
-    def __init__(self, base_url: str, api_key: str):
+    def __init__(
+        self,
+        base_url: str,
+        api_key: str,
+        client: Optional[httpx.Client] = None,
+        http2: bool = False,
+        health_ttl: float = 1.0,
+    ):
         """
         Initialize Trust Gateway client
 
         Args:
             base_url: Base URL of Trust Gateway API (e.g., http://localhost:8002)
             api_key: API key for authentication
+            client: Optional pre-built httpx.Client shared across clients
+            http2: Multiplex calls over one HTTP/2 connection with HPACK
+                header compression; requires the httpx[http2] extra and an
+                HTTP/2-capable gateway frontend
+            health_ttl: Seconds to serve health_check() from cache
         """
         self.base_url = base_url.rstrip("/")
         self.api_key = api_key
-        self.client = httpx.Client(headers={"X-API-Key": api_key}, timeout=30.0)
+        _install_url_templates(self)
+        self._health_ttl = health_ttl
+        self._health_cache: Optional[Tuple[float, Dict]] = None
+        self.client = client or httpx.Client(
+            headers={"X-API-Key": api_key},
+            timeout=30.0,
+            http2=http2,
+            limits=httpx.Limits(
+                max_keepalive_connections=32, max_connections=64, keepalive_expiry=90.0
+            ),
+            transport=httpx.HTTPTransport(
+                retries=3, http2=http2, uds=_uds_path(self.base_url)
+            ),
+        )
+        # Issued tokens stay valid for expires_in seconds; re-serve them
+        # until close to expiry instead of re-POSTing per call
+        self._token_cache: Dict[Tuple[str, int], Tuple[float, Dict]] = {}
 
     def close(self):
         """Close the HTTP client"""
@@ -223,88 +661,134 @@ class TrustClient:
     ) -> Dict:
         """Register a new agent with SPIFFE-compatible identity"""
         response = self.client.post(
-            f"{self.base_url}/agents/register",
-            json={
+            self._url_register,
+            content=orjson.dumps({
                 "name": name,
                 "provider": provider,
                 "spiffe_id": spiffe_id,
                 "config_hash": config_hash,
                 "capabilities": capabilities,
                 "attestation": attestation,
-            },
+            }),
+            headers=_JSON_HEADERS,
         )
         response.raise_for_status()
-        return response.json()
+        return orjson.loads(response.content)
 
     def get_agent(self, agent_id: str) -> Dict:
         """Get agent profile and current trust score"""
-        response = self.client.get(f"{self.base_url}/agents/{agent_id}")
+        response = self.client.get(self._url_agent % agent_id)
         response.raise_for_status()
-        return response.json()
+        return orjson.loads(response.content)
 
     def get_trust_breakdown(self, agent_id: str) -> Dict:
         """Get detailed trust score breakdown"""
-        response = self.client.get(f"{self.base_url}/agents/{agent_id}/trust")
+        response = self.client.get(self._url_trust % agent_id)
         response.raise_for_status()
-        return response.json()
+        return orjson.loads(response.content)
 
     def get_trust_history(self, agent_id: str, limit: int = 100) -> Dict:
         """Get trust score history"""
         response = self.client.get(
-            f"{self.base_url}/agents/{agent_id}/history", params={"limit": limit}
+            self._url_history % agent_id, params={"limit": limit}
         )
         response.raise_for_status()
-        return response.json()
+        return orjson.loads(response.content)
 
     def get_agent_card(self, agent_id: str) -> Dict:
         """Get A2A-compatible agent capability card"""
-        response = self.client.get(f"{self.base_url}/agents/{agent_id}/card")
+        response = self.client.get(self._url_card % agent_id)
         response.raise_for_status()
-        return response.json()
+        return orjson.loads(response.content)
 
     def issue_token(self, agent_id: str, expires_in: int = 3600) -> Dict:
-        """Issue JWT token for agent"""
+        """Issue JWT token for agent
+
+        Tokens are cached per (agent_id, expires_in) and re-served until
+        60 seconds before expiry, so hot callers pay a dict lookup rather
+        than a round trip.
+        """
+        key = (agent_id, expires_in)
+        entry = self._token_cache.get(key)
+        now = time.monotonic()
+        if entry is not None and now < entry[0]:
+            return entry[1]
+
         response = self.client.post(
-            f"{self.base_url}/agents/{agent_id}/token", params={"expires_in": expires_in}
+            self._url_token % agent_id, params={"expires_in": expires_in}
         )
         response.raise_for_status()
-        return response.json()
+        token = orjson.loads(response.content)
+        ttl = expires_in - _TOKEN_TTL_SKEW
+        if ttl > 0:
+            self._token_cache[key] = (now + ttl, token)
+        return token
 
     def record_action(
         self, agent_id: str, action: str, result: str, timestamp: Optional[datetime] = None
     ) -> Dict:
         """Record an action receipt"""
-        data = {"agent_id": agent_id, "action": action, "result": result}
-        if timestamp:
-            data["timestamp"] = timestamp.isoformat()
+        data = (
+            {"agent_id": agent_id, "action": action, "result": result}
+            if timestamp is None
+            else {
+                "agent_id": agent_id,
+                "action": action,
+                "result": result,
+                "timestamp": timestamp.isoformat(),
+            }
+        )
 
-        response = self.client.post(f"{self.base_url}/actions/record", json=data)
+        response = self.client.post(
+            self._url_record, content=orjson.dumps(data), headers=_JSON_HEADERS
+        )
         response.raise_for_status()
-        return response.json()
+        return orjson.loads(response.content)
+
+    def record_actions_batch(self, records: List[Dict[str, Any]]) -> List[Dict]:
+        """Record many action receipts in one request
+
+        Each record is a dict with agent_id, action, result and an optional
+        ISO-format timestamp. The gateway signs the whole batch with one
+        amortized pass over the receipt chain.
+        """
+        response = self.client.post(
+            self._url_record_batch,
+            content=orjson.dumps(records),
+            headers=_JSON_HEADERS,
+        )
+        response.raise_for_status()
+        return orjson.loads(response.content)
 
     def authorize(self, agent_id: str, action: str, context: Optional[Dict] = None) -> Dict:
         """Check if agent is authorized for an action"""
-        data = {"agent_id": agent_id, "action": action}
-        if context:
-            data["context"] = context
+        data = (
+            {"agent_id": agent_id, "action": action}
+            if context is None
+            else {"agent_id": agent_id, "action": action, "context": context}
+        )
 
-        response = self.client.post(f"{self.base_url}/authorize", json=data)
+        response = self.client.post(
+            self._url_authorize, content=orjson.dumps(data), headers=_JSON_HEADERS
+        )
         response.raise_for_status()
-        return response.json()
+        return orjson.loads(response.content)
 
     def authorize_batch(self, agent_id: str, actions: List[str]) -> Dict:
         """Batch authorization check"""
         response = self.client.post(
-            f"{self.base_url}/authorize/batch", json={"agent_id": agent_id, "actions": actions}
+            self._url_authorize_batch,
+            content=orjson.dumps({"agent_id": agent_id, "actions": actions}),
+            headers=_JSON_HEADERS,
         )
         response.raise_for_status()
-        return response.json()
+        return orjson.loads(response.content)
 
     def get_tiers(self) -> List[Dict]:
         """Get all trust tiers"""
-        response = self.client.get(f"{self.base_url}/tiers")
+        response = self.client.get(self._url_tiers)
         response.raise_for_status()
-        return response.json()
+        return orjson.loads(response.content)
 
     def update_tier(
         self,
@@ -317,71 +801,118 @@ class TrustClient:
     ) -> Dict:
         """Update tier configuration (admin only)"""
         response = self.client.put(
-            f"{self.base_url}/tiers/{tier}",
-            json={
+            self._url_tier % tier,
+            content=orjson.dumps({
                 "tier": tier,
                 "name": name,
                 "min_score": min_score,
                 "max_score": max_score,
                 "description": description,
                 "permissions": permissions,
-            },
+            }),
+            headers=_JSON_HEADERS,
         )
         response.raise_for_status()
-        return response.json()
+        return orjson.loads(response.content)
 
     def get_receipts(self, agent_id: str) -> List[Dict]:
         """Get action receipt chain"""
-        response = self.client.get(f"{self.base_url}/receipts/{agent_id}")
+        response = self.client.get(self._url_receipts % agent_id)
         response.raise_for_status()
-        return response.json()
+        return orjson.loads(response.content)
+
+    def iter_receipts(self, agent_id: str):
+        """Stream an agent's receipt chain, yielding receipts as they arrive
+
+        Consumes the NDJSON /receipts/{agent_id}/stream endpoint and
+        parses each line from raw bytes, so memory stays bounded by one
+        receipt rather than the whole chain.
+        """
+        with self.client.stream("GET", self._url_receipts_stream % agent_id) as response:
+            response.raise_for_status()
+            buffer = bytearray()
+            for chunk in response.iter_bytes():
+                buffer += chunk
+                while (newline := buffer.find(b"\n")) >= 0:
+                    line = bytes(buffer[:newline])
+                    del buffer[: newline + 1]
+                    if line:
+                        yield orjson.loads(line)
+            if buffer:
+                yield orjson.loads(bytes(buffer))
 
     def get_stats(self) -> Dict:
         """Get dashboard statistics"""
-        response = self.client.get(f"{self.base_url}/stats")
+        response = self.client.get(self._url_stats)
         response.raise_for_status()
-        return response.json()
+        return orjson.loads(response.content)
 
     def create_webhook(
         self, url: str, events: List[str], secret: Optional[str] = None
     ) -> Dict:
         """Create webhook configuration"""
         response = self.client.post(
-            f"{self.base_url}/config/webhooks",
-            json={"url": url, "events": events, "secret": secret},
+            self._url_webhooks,
+            content=orjson.dumps({"url": url, "events": events, "secret": secret}),
+            headers=_JSON_HEADERS,
         )
         response.raise_for_status()
-        return response.json()
+        return orjson.loads(response.content)
 
     def list_webhooks(self) -> List[Dict]:
         """List all webhooks"""
-        response = self.client.get(f"{self.base_url}/config/webhooks")
+        response = self.client.get(self._url_webhooks)
         response.raise_for_status()
-        return response.json()
+        return orjson.loads(response.content)
 
     def health_check(self) -> Dict:
-        """Check API health"""
-        response = self.client.get(f"{self.base_url}/health")
+        """Check API health
+
+        Served from a short TTL cache (default 1 s) so poll loops don't
+        pay a round trip per iteration.
+        """
+        entry = self._health_cache
+        now = time.monotonic()
+        if entry is not None and now < entry[0]:
+            return entry[1]
+
+        response = self.client.get(self._url_health)
         response.raise_for_status()
-        return response.json()
+        health = orjson.loads(response.content)
+        self._health_cache = (now + self._health_ttl, health)
+        return health
 
 
 class WebSocketDashboard:
     """WebSocket client for real-time Trust Gateway dashboard"""
 
-    def __init__(self, ws_url: str):
+    def __init__(self, ws_url: str, serialization: str = "json"):
         """
         Initialize WebSocket dashboard client
 
         Args:
             ws_url: WebSocket URL (e.g., ws://localhost:8002/ws/dashboard)
+            serialization: "json" (default) or "msgpack" for smaller,
+                faster-to-decode binary frames; requires the msgpack
+                package and a gateway that selects the subprotocol
         """
+        if serialization not in ("json", "msgpack"):
+            raise ValueError(f"Unsupported serialization: {serialization}")
+        if serialization == "msgpack" and msgpack is None:
+            raise ImportError("msgpack serialization requires the msgpack package")
         self.ws_url = ws_url
+        self.serialization = serialization
         self.ws = None
 
     async def connect(self):
-        """Connect to WebSocket"""
-        self.ws = await websockets.connect(self.ws_url)
+        """Connect to WebSocket
+
+        With msgpack serialization, offers the msgpack subprotocol; a
+        gateway that does not select it falls back to JSON frames
+        transparently.
+        """
+        subprotocols = ["msgpack", "json"] if self.serialization == "msgpack" else None
+        self.ws = await websockets.connect(self.ws_url, subprotocols=subprotocols)
 
     async def disconnect(self):
         """Disconnect from WebSocket"""
@@ -398,19 +929,31 @@ class WebSocketDashboard:
         if not self.ws:
             await self.connect()
 
+        # orjson parses str and bytes frames alike; msgpack only applies
+        # when the server actually selected that subprotocol
+        use_msgpack = (
+            self.serialization == "msgpack" and self.ws.subprotocol == "msgpack"
+        )
         try:
             async for message in self.ws:
-                data = json.loads(message)
+                if use_msgpack:
+                    data = msgpack.unpackb(message, raw=False)
+                else:
+                    data = orjson.loads(message)
                 await callback(data)
         except websockets.exceptions.ConnectionClosed:
             pass
 
     async def send_ping(self):
-        """Send keepalive ping"""
+        """Send keepalive ping
+
+        Uses the protocol-level PING control frame, which the server
+        answers without waking the application handler.
+        """
         if self.ws:
-            await self.ws.send("ping")
-            response = await self.ws.recv()
-            return response == "pong"
+            pong_waiter = await self.ws.ping()
+            await pong_waiter
+            return True
         return False
 
     async def __aenter__(self):
@@ -419,3 +962,17 @@ class WebSocketDashboard:
 
     async def __aexit__(self, exc_type, exc_val, exc_tb):
         await self.disconnect()
+
+
+@lru_cache(maxsize=8)
+def get_async_client(base_url: str, api_key: str) -> TrustClientAsync:
+    """Shared TrustClientAsync per (base_url, api_key)
+
+    Ad-hoc instantiation gives every caller its own connection pool,
+    paying TCP/TLS setup each time and defeating multiplexing. This
+    factory memoizes one client per gateway so the whole process shares
+    a single warm pool; call close() on it only at process shutdown.
+    The constructor remains available when per-caller isolation or
+    non-default options are needed.
+    """
+    return TrustClientAsync(base_url, api_key)